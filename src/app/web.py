@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
@@ -23,11 +24,29 @@ from src.services.extreme_quality_enhancer import ExtremeQualityEnhancer
 from src.services.media_verifier import MediaVerifier
 from src.services.smart_media_selector import SmartMediaSelector
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up voiceover dependencies once per worker, before serving requests."""
+    await voiceover_manager.warmup()
+
+    # Coqui is only a fallback engine and loading it takes tens of seconds
+    # (plus a download on first boot) - never hold up startup for it
+    preload = None
+    if Config.PRELOAD_TTS_MODEL:
+        preload = asyncio.create_task(voiceover_manager.preload_tts_model())
+
+    yield
+
+    if preload is not None and not preload.done():
+        preload.cancel()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Video Generator",
     description="Generate AI-powered videos from scripts with voiceovers and captions",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -188,8 +207,7 @@ async def generate_video(
 
         # Save voice recording if provided
         if voice_recording:
-            audio_data = await voice_recording.read()
-            await voiceover_manager.save_recording(audio_data, job_id, format="mp3")
+            await voiceover_manager.save_recording(voice_recording, job_id, format="mp3")
 
         # Start background processing
         if background_tasks:
@@ -473,8 +491,9 @@ async def process_video_job(job_id: str):
 
         # Sync scenes with audio timing
         scenes = await voiceover_manager.sync_audio_to_script(voiceover_path, scenes)
+        voiceover_duration = await voiceover_manager.get_audio_duration_async(voiceover_path)
         job_manager.update_job(job_id, progress=54)
-        print(f"✅ Voiceover ready! Duration: {voiceover_manager.get_audio_duration(voiceover_path):.1f}s")
+        print(f"✅ Voiceover ready! Duration: {voiceover_duration:.1f}s")
 
         # Step 4: Generate captions with WHISPER for accurate timing
         job_manager.update_job(job_id, progress=56)
@@ -505,7 +524,7 @@ async def process_video_job(job_id: str):
                 captions = await caption_generator.generate_captions_from_script(
                     script,
                     scenes,
-                    voiceover_manager.get_audio_duration(voiceover_path)
+                    voiceover_duration
                 )
                 captions = caption_generator.prepare_captions_for_video(
                     captions,
@@ -521,13 +540,13 @@ async def process_video_job(job_id: str):
         if options.get('add_music', True):
             music_path = await music_selector.select_music(
                 mood=mood,
-                duration=voiceover_manager.get_audio_duration(voiceover_path)
+                duration=voiceover_duration
             )
             if music_path:
                 job_manager.update_job(job_id, progress=70)
                 music_path = music_selector.adjust_music_duration(
                     music_path,
-                    voiceover_manager.get_audio_duration(voiceover_path)
+                    voiceover_duration
                 )
                 print(f"✅ Background music ready!")
             job_manager.update_job(job_id, progress=72)
@@ -40,6 +40,10 @@ class Config:
     MAX_CONCURRENT_JOBS: int = int(os.getenv("MAX_CONCURRENT_JOBS", "2"))
     JOB_TIMEOUT_SECONDS: int = int(os.getenv("JOB_TIMEOUT_SECONDS", "600"))
 
+    # Load the Coqui TTS model in the background after startup instead of
+    # on the first request that falls back to it
+    PRELOAD_TTS_MODEL: bool = os.getenv("PRELOAD_TTS_MODEL", "false").lower() == "true"
+
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev_secret_key")
 
@@ -1,20 +1,251 @@
 """Video generation engine using MoviePy."""
 
 import asyncio
+import bisect
+import functools
+import json
+import math
+import os
+import queue
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import TYPE_CHECKING, List, Dict, Optional, Callable
 import random
 
-from moviepy import (
-    VideoFileClip,
-    ImageClip,
-    AudioFileClip,
-    CompositeVideoClip,
-    CompositeAudioClip,
-    TextClip,
-    concatenate_videoclips,
-)
-from moviepy.video.fx import FadeIn, FadeOut, Resize, CrossFadeIn, CrossFadeOut, Crop
+import numpy as np
+
+# MoviePy is imported lazily inside the methods that need it - importing it
+# pulls in imageio/proglog and locates ffmpeg, which status/info code paths
+# that only construct a VideoGenerator shouldn't pay for
+if TYPE_CHECKING:
+    from moviepy import VideoClip, VideoFileClip
+
+
+# Upper bound on frames the loop filter may hold in memory per scene worker
+_LOOP_CACHE_BYTES = 256 * 1024 * 1024
+
+# Generous upper bound on the size of 720p intermediates (scene renders and
+# export segments) per second of video, for scratch space checks
+_SCRATCH_BYTES_PER_SECOND = 4 * 1024 * 1024
+
+# Most segment workers an export runs at once - each holds its own MoviePy
+# timeline and encoder, so past this memory grows faster than throughput
+_MAX_SEGMENT_WORKERS = 8
+
+# Scratch bytes promised to in-flight jobs in this process, so concurrent
+# jobs checking free space at the same moment can't both claim it
+_scratch_reserved = 0
+_scratch_lock = threading.Lock()
+
+# Scene transitions: (crossfade-in over the previous scene, fade-in from
+# black, fade-out to black) in seconds
+_TRANSITIONS: Dict[str, tuple] = {
+    "crossfade": (0.5, 0.0, 0.0),   # Smooth crossfade (peaceful content)
+    "zoom": (0.3, 0.0, 0.0),        # Quicker crossfade (emphasis)
+    "quick_cut": (0.0, 0.1, 0.1),   # Near-hard cut (fast-paced)
+    "fade_black": (0.0, 0.2, 0.5),  # Dramatic pause, longer fade out
+}
+
+# Output resolution per aspect ratio
+_RESOLUTIONS: Dict[str, tuple] = {
+    "16:9": (1280, 720),       # YouTube, Desktop - 720p HD
+    "9:16": (720, 1280),       # YouTube Shorts, TikTok, Reels - 720p vertical
+    "1:1": (720, 720),         # Instagram Square - 720p
+    "4:5": (720, 900),         # Instagram Portrait - 720p
+}
+
+
+def _available_cpus() -> int:
+    """
+    CPUs this process may run on.
+
+    Honors affinity masks (taskset, container cpusets), where os.cpu_count()
+    reports every core on the host.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 4
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(path: str, size: int):
+    """Open a font once per (path, size) - captions mostly share one style."""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        # Font file missing on this machine (e.g. the macOS default on Linux)
+        return ImageFont.load_default(size)
+
+
+@functools.lru_cache(maxsize=512)
+def _render_text_bitmap(
+    text: str,
+    font_size: int,
+    color: str,
+    stroke_color: Optional[str],
+    stroke_width: int,
+    font: str,
+    width: int
+) -> np.ndarray:
+    """Rasterize a caption with Pillow once and return it as an RGBA array."""
+    from PIL import Image, ImageDraw
+
+    pil_font = _load_font(font, font_size)
+    has_stroke = bool(stroke_color) and stroke_color != 'none'
+    stroke = stroke_width if has_stroke else 0
+
+    # Greedy word wrap to the caption width
+    measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ''
+        for word in paragraph.split():
+            candidate = f'{line} {word}' if line else word
+            if line and measure.textlength(candidate, font=pil_font) + 2 * stroke > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    wrapped = '\n'.join(lines)
+
+    # Size the bitmap to the ink (stroke included) so no glyph gets clipped
+    left, top, right, bottom = measure.multiline_textbbox(
+        (0, 0), wrapped, font=pil_font, align='center', stroke_width=stroke
+    )
+    left, top = math.floor(left), math.floor(top)
+    width, height = max(1, math.ceil(right) - left), max(1, math.ceil(bottom) - top)
+    image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    ImageDraw.Draw(image).multiline_text(
+        (-left, -top),
+        wrapped,
+        font=pil_font,
+        fill=color,
+        align='center',
+        stroke_width=stroke,
+        stroke_fill=stroke_color if has_stroke else None
+    )
+    return np.asarray(image)
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_components(kind: str) -> frozenset:
+    """List the names FFmpeg reports for '-filters' / '-encoders' (probed once per process)."""
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', f'-{kind}'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+    return frozenset(
+        parts[1] for parts in (line.split() for line in result.stdout.splitlines())
+        if len(parts) > 1
+    )
+
+
+def _ffmpeg_has_filter(name: str) -> bool:
+    """Check whether the local FFmpeg build ships a given filter (e.g. libass 'subtitles')."""
+    return name in _ffmpeg_components('filters')
+
+
+def _ffmpeg_has_encoder(name: str) -> bool:
+    """Check whether the local FFmpeg build ships a given encoder (e.g. 'h264_videotoolbox')."""
+    return name in _ffmpeg_components('encoders')
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_media(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Read width/height/duration/fps of a media file with one ffprobe call.
+
+    mtime_ns and size are only part of the cache key, so a file rewritten
+    in place is probed again. Returns an empty dict if probing fails.
+    """
+    try:
+        result = subprocess.run(
+            [
+                'ffprobe', '-v', 'error', '-print_format', 'json',
+                '-show_streams', '-show_format', '-select_streams', 'v:0', path
+            ],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        data = json.loads(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return {}
+
+    streams = data.get('streams') or [{}]
+    stream = streams[0]
+    info = {}
+    if stream.get('width') and stream.get('height'):
+        info['width'] = int(stream['width'])
+        info['height'] = int(stream['height'])
+        # FFmpeg autorotates on decode, so report the displayed orientation
+        rotation = stream.get('tags', {}).get('rotate') or next(
+            (side.get('rotation') for side in stream.get('side_data_list', []) if 'rotation' in side),
+            0
+        )
+        if int(float(rotation)) % 180:
+            info['width'], info['height'] = info['height'], info['width']
+
+    duration = stream.get('duration') or data.get('format', {}).get('duration')
+    if duration not in (None, 'N/A'):
+        info['duration'] = float(duration)
+
+    rate = stream.get('avg_frame_rate') or stream.get('r_frame_rate') or '0/0'
+    num, _, den = rate.partition('/')
+    if num.isdigit() and den.isdigit() and int(den):
+        info['fps'] = int(num) / int(den)
+    return info
+
+
+def _escape_filter_value(value: str) -> str:
+    """Escape a filter option value for both the option and the filtergraph parser."""
+    for char in "\\':":
+        value = value.replace(char, '\\' + char)
+    for char in "\\'[],;":
+        value = value.replace(char, '\\' + char)
+    return value
+
+
+def _ass_color(color: Optional[str]) -> str:
+    """Convert a CSS/PIL color name or hex string to ASS &HAABBGGRR notation."""
+    from PIL import ImageColor
+
+    red, green, blue = ImageColor.getrgb(color or 'black')[:3]
+    return f"&H00{blue:02X}{green:02X}{red:02X}"
+
+
+def _aligned_frame(shape: tuple, alignment: int = 32) -> np.ndarray:
+    """Allocate an uninitialized uint8 frame whose data starts on an aligned address."""
+    nbytes = int(np.prod(shape))
+    raw = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + nbytes].reshape(shape)
+
+
+def _fast_blend(a: np.ndarray, b, alpha) -> np.ndarray:
+    """
+    Blend uint8 pixels as a*alpha + b*(255-alpha), with alpha in 0-255.
+
+    Works in 16-bit integers end to end (exact rounding of x/255), so
+    crossfades and fades never widen frames to float.
+    """
+    alpha = np.asarray(alpha, dtype=np.uint16)
+    mixed = np.multiply(a, alpha, dtype=np.uint16)
+    mixed += np.multiply(b, 255 - alpha, dtype=np.uint16)
+    mixed += 128
+    mixed += mixed >> 8
+    return (mixed >> 8).astype(np.uint8)
 
 
 class VideoGenerator:
@@ -24,9 +255,19 @@ class VideoGenerator:
         self,
         output_dir: Path = Path("./output"),
         temp_dir: Path = Path("./data/temp"),
-        aspect_ratio: str = "16:9"
+        aspect_ratio: str = "16:9",
+        ken_burns: bool = True,
+        preset: str = "medium",
+        crf: int = 23
     ):
-        """Initialize video generator with configurable aspect ratio."""
+        """
+        Initialize video generator with configurable aspect ratio.
+
+        Args:
+            ken_burns: Slow zoom on still-image scenes
+            preset: libx264 preset for the CPU fallback encode
+            crf: libx264 CRF for the CPU fallback encode
+        """
         self.output_dir = output_dir
         self.temp_dir = temp_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -35,17 +276,56 @@ class VideoGenerator:
         # Video settings - SUPPORT MULTIPLE ASPECT RATIOS
         self.aspect_ratio = aspect_ratio
         self.resolution = self._get_resolution(aspect_ratio)
+        self._target_w, self._target_h = self.resolution
         self.fps = 30
+        self.ken_burns = ken_burns
+        self.preset = preset
+        self.crf = crf
+
+        # Apple Silicon media engine if this FFmpeg build has it, else libx264
+        self.hardware_encoder = _ffmpeg_has_encoder('h264_videotoolbox')
+
+        # RAM-backed scratch space (Linux tmpfs) for intermediates that FFmpeg
+        # writes once and reads back during the export
+        self.scratch_dir = None
+        shm = Path('/dev/shm')
+        if shm.is_dir() and os.access(shm, os.W_OK):
+            self.scratch_dir = shm / 'ai-video-generator'
+            self.scratch_dir.mkdir(exist_ok=True)
+
+    def _reserve_scratch(self, seconds: float, fallback: Path) -> tuple:
+        """
+        Pick where to write intermediates covering `seconds` of video.
+
+        Uses the tmpfs scratch directory when it has room for them with 2x
+        headroom (tmpfs is shared with RAM) on top of what other jobs have
+        already reserved, otherwise the on-disk fallback. Pass the reserved
+        byte count to _release_scratch once the files are gone.
+
+        Returns:
+            (directory, reserved bytes)
+        """
+        global _scratch_reserved
+        if self.scratch_dir:
+            needed = int(2 * seconds * _SCRATCH_BYTES_PER_SECOND)
+            with _scratch_lock:
+                stats = os.statvfs(self.scratch_dir)
+                if stats.f_bavail * stats.f_frsize - _scratch_reserved > needed:
+                    _scratch_reserved += needed
+                    return self.scratch_dir, needed
+        return fallback, 0
+
+    @staticmethod
+    def _release_scratch(reserved: int):
+        """Return scratch space reserved by _reserve_scratch."""
+        global _scratch_reserved
+        if reserved:
+            with _scratch_lock:
+                _scratch_reserved -= reserved
 
     def _get_resolution(self, aspect_ratio: str) -> tuple:
         """Get resolution for different aspect ratios - optimized 720p for speed."""
-        resolutions = {
-            "16:9": (1280, 720),       # YouTube, Desktop - 720p HD
-            "9:16": (720, 1280),       # YouTube Shorts, TikTok, Reels - 720p vertical
-            "1:1": (720, 720),         # Instagram Square - 720p
-            "4:5": (720, 900),         # Instagram Portrait - 720p
-        }
-        return resolutions.get(aspect_ratio, (1280, 720))
+        return _RESOLUTIONS.get(aspect_ratio, (1280, 720))
 
     async def generate_video(
         self,
@@ -72,47 +352,50 @@ class VideoGenerator:
         Returns:
             Path to generated video file
         """
+        video_clips = []
+        final_video = None
+        caption_file = None
+        scene_dir, scratch_reserved = self._reserve_scratch(
+            sum(scene.get('duration', 5) for scene in scenes), self.temp_dir
+        )
         try:
             if progress_callback:
                 progress_callback(10)
 
             # Create video clips from scenes and media
-            video_clips = await self._create_scene_clips(scenes, media_files_with_metadata)
+            video_clips = await self._create_scene_clips(
+                job_id, scenes, media_files_with_metadata, scene_dir
+            )
 
             if progress_callback:
                 progress_callback(30)
 
             # Concatenate all clips with professional crossfade transitions
             print(f"🎬 Assembling {len(video_clips)} scenes with crossfade transitions...")
-            final_video = concatenate_videoclips(
+            final_video = self._chain_scenes(  # Overlap clips by 0.5s for smooth crossfade
                 video_clips,
-                method="compose",
-                padding=-0.5  # Overlap clips by 0.5s for smooth crossfade
+                [metadata.get('transition_out', 'crossfade') for _, metadata in media_files_with_metadata]
             )
 
             if progress_callback:
                 progress_callback(50)
 
-            # Add voiceover audio
-            voiceover_audio = AudioFileClip(str(audio_path))
-
-            # Add background music if provided
+            # Voiceover + optional background music are mixed inside the encoder
+            audio_inputs = [audio_path]
             if background_music and background_music.exists():
-                music_audio = AudioFileClip(str(background_music))
-                # Mix voiceover and music
-                final_audio = CompositeAudioClip([voiceover_audio, music_audio])
-            else:
-                final_audio = voiceover_audio
-
-            # Set audio to video (MoviePy 2.x uses with_audio instead of set_audio)
-            final_video = final_video.with_audio(final_audio)
+                audio_inputs.append(background_music)
 
             if progress_callback:
                 progress_callback(70)
 
-            # Add captions if provided
+            # Burn captions in during the encode (libass) - fall back to compositing
+            caption_filter = None
             if captions:
-                final_video = self._add_captions_to_video(final_video, captions)
+                if _ffmpeg_has_filter('subtitles'):
+                    caption_file = self.temp_dir / f"{job_id}_captions.ass"
+                    caption_filter = self._write_ass_file(captions, caption_file)
+                else:
+                    final_video = self._add_captions_to_video(final_video, captions)
 
             if progress_callback:
                 progress_callback(85)
@@ -123,12 +406,25 @@ class VideoGenerator:
             # Calculate total frames for progress
             total_frames = int(final_video.duration * self.fps)
 
-            def video_progress(current_frame, total_frames):
-                """Update progress during video rendering."""
-                if progress_callback and total_frames > 0:
+            loop = asyncio.get_running_loop()
+
+            # Picklable description of the timeline so long exports can render
+            # frame spans in parallel worker processes
+            timeline = {
+                'scenes': [
+                    (clip.filename, metadata.get('transition_out', 'crossfade'), clip.duration)
+                    for clip, (_, metadata) in zip(video_clips, media_files_with_metadata)
+                ],
+                'captions': captions if captions and not caption_filter else None
+            }
+            export = functools.partial(self._export_chunked, timeline=timeline)
+
+            def video_progress(current_frame):
+                """Update progress during video rendering (called from the writer thread)."""
+                if progress_callback and total_frames > 0 and current_frame % self.fps == 0:
                     # Map frame progress to 85-95% range
                     frame_progress = int((current_frame / total_frames) * 10) + 85
-                    progress_callback(min(95, frame_progress))
+                    loop.call_soon_threadsafe(progress_callback, min(95, frame_progress))
 
             print(f"🎬 Exporting 720p HD video ({total_frames} frames) - OPTIMAL SPEED/QUALITY BALANCE...")
             print(f"🚀 Using M4 Mac GPU + ALL CPU cores...")
@@ -136,242 +432,890 @@ class VideoGenerator:
             # OPTIMAL BASELINE: MEDIUM preset + CRF 23 for 720p social media
             # Research shows: 'medium' = best balance, CRF 23 = great quality for 720p
             try:
+                if not self.hardware_encoder:
+                    raise RuntimeError("h264_videotoolbox not available in this FFmpeg build")
+
                 # Try M4 Mac hardware acceleration (10x faster!)
-                final_video.write_videofile(
-                    str(output_path),
-                    fps=self.fps,
-                    codec='h264_videotoolbox',  # M4 GPU HARDWARE ENCODER
-                    audio_codec='aac',
-                    audio_bitrate='256k',  # High quality audio (sweet spot)
-                    bitrate='5000k',  # 5 Mbps = Perfect for 720p social media
-                    temp_audiofile=str(self.temp_dir / f"{job_id}_temp_audio.m4a"),
-                    remove_temp=True,
-                    threads=0,  # USE ALL M4 CORES
-                    logger='bar',
-                    ffmpeg_params=[
-                        '-b:v', '5000k',  # Target bitrate
-                        '-maxrate', '6000k',  # Max bitrate
-                        '-bufsize', '10000k',  # Buffer
-                        '-q:v', '65',  # Quality for VideoToolbox (65 = high quality)
+                await loop.run_in_executor(
+                    None,
+                    export,
+                    final_video,
+                    output_path,
+                    [
+                        '-c:v', 'h264_videotoolbox',  # M4 GPU HARDWARE ENCODER
+                        '-q:v', '65',  # Quality mode (65 = high quality) - no -b:v, which would force CBR-style rate control
+                        '-maxrate', '8000k',  # VBV ceiling for motion-heavy scenes
+                        '-bufsize', '12000k',  # Buffer
+                        '-allow_sw', '0',  # Fail over to libx264 rather than VT's slow software path
+                        '-realtime', '0',  # Favor quality over realtime pacing
+                        '-profile:v', 'high',
                         '-pix_fmt', 'yuv420p',
-                        '-movflags', '+faststart',
-                        '-tag:v', 'hvc1'  # Better compatibility
-                    ]
+                        '-movflags', '+faststart+frag_keyframe+empty_moov'  # moov up front, no post-encode rewrite
+                    ],
+                    audio_inputs,
+                    video_progress,
+                    caption_filter
                 )
                 print(f"✅ M4 GPU hardware encoding complete! (10x faster!)")
             except Exception as hw_error:
                 print(f"⚠️ GPU encoder unavailable ({hw_error}), using optimized CPU...")
                 
                 # Fallback: MEDIUM preset CPU (optimal balance)
-                final_video.write_videofile(
-                    str(output_path),
-                    fps=self.fps,
-                    codec='libx264',
-                    audio_codec='aac',
-                    audio_bitrate='256k',  # High quality audio
-                    temp_audiofile=str(self.temp_dir / f"{job_id}_temp_audio.m4a"),
-                    remove_temp=True,
-                    preset='medium',  # OPTIMAL BALANCE: Great quality, good speed
-                    threads=0,  # ALL CPU cores
-                    logger='bar',
-                    ffmpeg_params=[
-                        '-crf', '23',  # CRF 23 = Excellent quality for 720p social media
+                # One slice thread per core - x264's default 1.5x oversubscribes
+                # the efficiency cores on hybrid (P/E) CPUs
+                threads = _available_cpus()
+                await loop.run_in_executor(
+                    None,
+                    export,
+                    final_video,
+                    output_path,
+                    [
+                        '-c:v', 'libx264',
+                        '-preset', self.preset,  # 'medium' default = OPTIMAL BALANCE
+                        '-threads', str(threads),  # ALL CPU cores
+                        # Small frame FIFO: no B-frames, 2 refs, short lookahead
+                        '-tune', 'film,zerolatency',
+                        '-bf', '0',
+                        '-refs', '2',
+                        '-x264-params', (
+                            f'sliced-threads=1:threads={threads}'
+                            ':lookahead-threads=2:rc-lookahead=10:sync-lookahead=0'
+                        ),
+                        '-crf', str(self.crf),  # CRF 23 default = Excellent quality for 720p social media
                         '-pix_fmt', 'yuv420p',
                         '-profile:v', 'main',  # 'main' profile = faster than 'high', great quality
                         '-level', '4.0',
-                        '-movflags', '+faststart',
-                        '-tune', 'film'  # Optimize for video content
-                    ]
+                        '-movflags', '+faststart+frag_keyframe+empty_moov'  # moov up front, no post-encode rewrite
+                    ],
+                    audio_inputs,
+                    video_progress,
+                    caption_filter
                 )
-                print(f"✅ CPU encoding complete with medium preset!")
+                print(f"✅ CPU encoding complete with {self.preset} preset!")
 
             print(f"✅ EXTREME QUALITY export complete!")
 
             if progress_callback:
                 progress_callback(100)
 
-            # Clean up
-            final_video.close()
-            voiceover_audio.close()
-            if background_music:
-                music_audio.close()
-
             return output_path
 
         except Exception as e:
             raise Exception(f"Video generation failed: {e}")
 
+        finally:
+            # Clean up on failure too - scene files on tmpfs hold RAM until
+            # deleted, and each open reader owns an ffmpeg process. The
+            # concatenation doesn't own the scene readers
+            if final_video is not None:
+                final_video.close()
+            for clip in video_clips:
+                clip.close()
+            if caption_file:
+                caption_file.unlink(missing_ok=True)
+            for scene_file in {clip.filename for clip in video_clips}:
+                Path(scene_file).unlink(missing_ok=True)
+            self._release_scratch(scratch_reserved)
+
+    def _pipe_export(
+        self,
+        video,
+        output_path: Path,
+        encoder_params: List[str],
+        audio_inputs: Optional[List[Path]] = None,
+        on_frame: Optional[Callable[[int], None]] = None,
+        video_filter: Optional[str] = None,
+        prefetch: int = 8,
+        start_frame: int = 0,
+        frame_count: Optional[int] = None
+    ) -> Path:
+        """
+        Stream rendered frames straight into a single FFmpeg encoder process.
+
+        A reader thread decodes and composites frames (MoviePy's get_frame does
+        both in one call) into a bounded queue while a writer thread feeds them
+        to FFmpeg's stdin, so frame N+1 is being built while frame N is encoded.
+        The queue size caps how far rendering can run ahead of the encoder.
+
+        Frames are copied into a small ring of preallocated, 32-byte aligned
+        buffers and handed to the pipe by reference, so the export allocates
+        no per-frame arrays or bytes objects of its own.
+
+        Audio files are passed to the same FFmpeg process as extra inputs and
+        mixed there (voice-keyed sidechaincompress + amix), so no intermediate
+        soundtrack is written.
+
+        start_frame/frame_count select a frame-aligned span of the timeline
+        (the whole clip by default), which is how _export_chunked feeds it.
+        """
+        width, height = video.size
+        if frame_count is None:
+            frame_count = int(video.duration * self.fps) - start_frame
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error', '-nostats',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f'{width}x{height}', '-r', str(self.fps),
+            '-i', 'pipe:0'
+        ]
+        cmd += self._audio_mux_args(audio_inputs or [])
+        # RGB -> YUV with the BT.709 matrix so the stream matches its colour tags
+        color_convert = 'scale=out_color_matrix=bt709:out_range=tv'
+        cmd += ['-vf', f'{video_filter},{color_convert}' if video_filter else color_convert]
+        cmd += ['-colorspace', 'bt709', '-color_primaries', 'bt709', '-color_trc', 'bt709', '-color_range', 'tv']
+        # Pin the output rate - setpts in the filter chain drops the link's frame rate
+        cmd += ['-r', str(self.fps)]
+        cmd += encoder_params + [str(output_path)]
+
+        # stdin is an io.BufferedWriter - a 1 MB buffer batches writes into
+        # large pipe chunks instead of the 8 KB default
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20)
+        frames: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        errors = []
+
+        # One buffer per queue slot, plus the one being written and the one being filled
+        buffers = [_aligned_frame((height, width, 3)) for _ in range(prefetch + 2)]
+
+        def read_frames():
+            """Decode + composite stage."""
+            try:
+                for index in range(frame_count):
+                    frame = buffers[index % len(buffers)]
+                    np.copyto(frame, video.get_frame((start_frame + index) / self.fps), casting='unsafe')
+                    while not stop.is_set():
+                        try:
+                            frames.put(frame, timeout=0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                errors.append(e)
+            finally:
+                frames.put(None)
+
+        def write_frames():
+            """Encode stage - FFmpeg does the actual work in its own process."""
+            count = 0
+            try:
+                while (frame := frames.get()) is not None:
+                    process.stdin.write(frame.data)
+                    count += 1
+                    if on_frame:
+                        on_frame(count)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+                # Drain so the reader never blocks on a full queue
+                while frames.get() is not None:
+                    pass
+            finally:
+                process.stdin.close()
+
+        reader = threading.Thread(target=read_frames, daemon=True)
+        writer = threading.Thread(target=write_frames, daemon=True)
+        reader.start()
+        writer.start()
+        reader.join()
+        writer.join()
+
+        stderr = process.stderr.read().decode(errors='replace')
+        process.stderr.close()
+        if process.wait() != 0:
+            raise RuntimeError(f"FFmpeg exited with code {process.returncode}: {stderr.strip()}")
+        if errors:
+            raise errors[0]
+
+        return output_path
+
+    def _audio_mux_args(self, audio_inputs: List[Path]) -> List[str]:
+        """
+        FFmpeg arguments that add the soundtrack to an output whose input 0 is video.
+
+        The first audio input is the voiceover: it keys a compressor that ducks
+        the other tracks while someone is speaking, then everything is summed
+        (normalize=0 keeps the voice at full level).
+        """
+        if not audio_inputs:
+            return []
+
+        args = []
+        for audio_input in audio_inputs:
+            args += ['-i', str(audio_input)]
+
+        if len(audio_inputs) > 1:
+            beds = ''.join(f'[{i}:a]' for i in range(2, len(audio_inputs) + 1))
+            if len(audio_inputs) > 2:
+                beds += f'amix=inputs={len(audio_inputs) - 1}:normalize=0'
+            else:
+                beds += 'anull'
+            args += [
+                '-filter_complex',
+                (
+                    f'[1:a]asplit=2[voice][key];{beds}[bed];'
+                    '[bed][key]sidechaincompress=threshold=0.05:ratio=6:attack=20:release=400[ducked];'
+                    '[voice][ducked]amix=inputs=2:duration=first:dropout_transition=2:normalize=0[aout]'
+                ),
+                '-map', '0:v', '-map', '[aout]'
+            ]
+        else:
+            args += ['-map', '0:v', '-map', '1:a']
+
+        return args + ['-c:a', 'aac', '-b:a', '256k', '-ar', '44100', '-shortest']
+
+    def _export_chunked(
+        self,
+        video,
+        output_path: Path,
+        encoder_params: List[str],
+        audio_inputs: Optional[List[Path]] = None,
+        on_frame: Optional[Callable[[int], None]] = None,
+        video_filter: Optional[str] = None,
+        chunk_seconds: int = 15,
+        *,
+        timeline: Dict
+    ) -> Path:
+        """
+        Export long timelines as ~15s video-only segments, then stitch them.
+
+        Each segment is a frame-aligned span rendered through _pipe_export by a
+        fresh encoder process, so encoder and muxer state (lookahead buffers,
+        sample tables) is bounded per segment however long the video is. The segments
+        are joined with the concat demuxer (-c copy) in a final pass that also
+        mixes and muxes the soundtrack, so audio is encoded exactly once and
+        can't drift at segment boundaries.
+
+        Segments are rendered in parallel worker processes from the
+        serializable `timeline` description (see _render_span) - MoviePy
+        composites frames on one thread, so this is what scales the frame
+        production across cores. The CPUs are split between the workers:
+        each segment encoder gets its share of the threads, not all of them.
+
+        Timelines shorter than two chunks go straight through _pipe_export.
+        """
+        total_frames = int(video.duration * self.fps)
+        chunk_frames = chunk_seconds * self.fps
+        if total_frames <= 2 * chunk_frames:
+            return self._pipe_export(video, output_path, encoder_params, audio_inputs, on_frame, video_filter)
+
+        # Segments are plain (non-fragmented) MP4 - the concat demuxer needs
+        # their sample tables to place each one exactly on the timeline
+        segment_params = list(encoder_params)
+        if '-movflags' in segment_params:
+            index = segment_params.index('-movflags')
+            del segment_params[index:index + 2]
+
+        segment_dir, scratch_reserved = self._reserve_scratch(video.duration, output_path.parent)
+        spans = []
+        for start_frame in range(0, total_frames, chunk_frames):
+            # Filters that look at timestamps (subtitles) see timeline time
+            segment_filter = None
+            if video_filter:
+                segment_filter = (
+                    f'setpts=PTS+{start_frame}/({self.fps}*TB),{video_filter},setpts=PTS-STARTPTS'
+                )
+            spans.append((
+                start_frame,
+                min(chunk_frames, total_frames - start_frame),
+                segment_dir / f"{output_path.stem}_seg{len(spans):04d}.mp4",
+                segment_filter
+            ))
+
+        segments = [segment_path for _, _, segment_path, _ in spans]
+        list_file = segment_dir / f"{output_path.stem}_segments.txt"
+        try:
+            max_workers = min(_available_cpus(), _MAX_SEGMENT_WORKERS, len(spans))
+            self._split_encoder_threads(segment_params, max_workers)
+            print(f"🎬 Rendering {len(spans)} segments in PARALLEL ({max_workers} processes)...")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._render_span,
+                        timeline,
+                        start_frame,
+                        frame_count,
+                        segment_path,
+                        segment_params,
+                        segment_filter
+                    ): frame_count
+                    for start_frame, frame_count, segment_path, segment_filter in spans
+                }
+                frames_done = 0
+                for future in as_completed(futures):
+                    future.result()
+                    frames_done += futures[future]
+                    if on_frame:
+                        on_frame(frames_done)
+
+            list_file.write_text(
+                ''.join(f"file '{segment.resolve()}'\n" for segment in segments),
+                encoding='utf-8'
+            )
+            subprocess.run(
+                [
+                    'ffmpeg', '-y', '-loglevel', 'error', '-nostats',
+                    '-f', 'concat', '-safe', '0', '-i', str(list_file)
+                ]
+                + self._audio_mux_args(audio_inputs or [])
+                + [
+                    '-c:v', 'copy',
+                    '-avoid_negative_ts', 'make_zero',
+                    '-movflags', '+faststart+frag_keyframe+empty_moov',
+                    str(output_path)
+                ],
+                check=True,
+                capture_output=True
+            )
+        finally:
+            list_file.unlink(missing_ok=True)
+            for segment in segments:
+                segment.unlink(missing_ok=True)
+            self._release_scratch(scratch_reserved)
+
+        return output_path
+
+    @staticmethod
+    def _split_encoder_threads(encoder_params: List[str], workers: int) -> None:
+        """
+        Scale encoder thread counts in place for `workers` concurrent encoders.
+
+        Rewrites '-threads N' and x264's 'threads=N' to N // workers (at least
+        one), so parallel segment encoders share the cores instead of each
+        spawning a full set of threads.
+        """
+        if '-threads' in encoder_params:
+            index = encoder_params.index('-threads') + 1
+            encoder_params[index] = str(max(1, int(encoder_params[index]) // workers))
+        if '-x264-params' in encoder_params:
+            index = encoder_params.index('-x264-params') + 1
+            options = encoder_params[index].split(':')
+            for i, option in enumerate(options):
+                key, _, value = option.partition('=')
+                if key == 'threads' and value.isdigit():
+                    options[i] = f'threads={max(1, int(value) // workers)}'
+            encoder_params[index] = ':'.join(options)
+
+    def _render_span(
+        self,
+        timeline: Dict,
+        start_frame: int,
+        frame_count: int,
+        segment_path: Path,
+        encoder_params: List[str],
+        video_filter: Optional[str] = None
+    ) -> Path:
+        """
+        Render one frame span of the timeline to a segment (runs in process pool).
+
+        Live clips hold readers and locks that can't be pickled, so the worker
+        rebuilds the timeline from its description - scene files, transitions
+        and durations laid out exactly like _chain_scenes - opening only the
+        scenes that overlap its own span.
+
+        Args:
+            timeline: {'scenes': [(path, transition, duration)], 'captions': fallback captions or None}
+        """
+        from moviepy import VideoFileClip
+
+        span_start = start_frame / self.fps
+        span_end = (start_frame + frame_count) / self.fps
+
+        sources = []
+        clips = []
+        transitions = []
+        offset = None
+        scene_start = 0.0
+        for scene_path, transition, duration in timeline['scenes']:
+            scene_end = scene_start + duration
+            if scene_end > span_start and scene_start < span_end:
+                clip = VideoFileClip(scene_path)
+                sources.append(clip)
+                if clip.duration > duration:
+                    # Prefix of a render shared with a longer scene
+                    clip = clip.subclipped(0, duration)
+                clips.append(self._apply_smart_transition(clip, transition))
+                transitions.append(transition)
+                if offset is None:
+                    offset = scene_start
+            # Scenes overlap by 0.5s for the crossfade
+            scene_start = scene_end - 0.5
+
+        try:
+            video = self._chain_scenes(clips, transitions, start=offset)
+            if timeline.get('captions'):
+                video = self._add_captions_to_video(video, timeline['captions'])
+
+            return self._pipe_export(
+                video,
+                segment_path,
+                encoder_params,
+                None,
+                None,
+                video_filter,
+                start_frame=start_frame,
+                frame_count=frame_count
+            )
+        finally:
+            for clip in sources:
+                clip.close()
+
+    def _chain_scenes(
+        self,
+        clips: List["VideoClip"],
+        transitions: List[str],
+        overlap: float = 0.5,
+        start: float = 0.0
+    ) -> "VideoClip":
+        """
+        Lay scenes end to end, each overlapping the next by `overlap` seconds.
+
+        Same frames as concatenate_videoclips(method="compose", padding=-overlap)
+        with CrossFadeIn masks, without the composite: a frame inside one scene
+        is that scene's frame as-is, and in an overlap window the incoming scene
+        is blended over the outgoing one in uint8 (_fast_blend).
+
+        Args:
+            transitions: Transition name per clip (its crossfade-in is used)
+            start: Timeline time of the first clip, for partial timelines
+        """
+        from moviepy import VideoClip
+
+        starts = []
+        scene_start = start
+        for clip in clips:
+            starts.append(scene_start)
+            scene_start += clip.duration - overlap
+        end = scene_start + overlap
+        crossfades = [_TRANSITIONS.get(name, _TRANSITIONS['crossfade'])[0] for name in transitions]
+
+        def frame_function(t):
+            # Newest scene that has started, plus any older ones still playing
+            newest = max(0, bisect.bisect_right(starts, t) - 1)
+            oldest = newest
+            while oldest > 0 and starts[oldest - 1] + clips[oldest - 1].duration > t:
+                oldest -= 1
+
+            frame = clips[oldest].get_frame(max(0.0, t - starts[oldest]))
+            for i in range(oldest + 1, newest + 1):
+                local_t = t - starts[i]
+                incoming = clips[i].get_frame(local_t)
+                if crossfades[i] and local_t < crossfades[i]:
+                    frame = _fast_blend(incoming, frame, round(255 * local_t / crossfades[i]))
+                else:
+                    frame = incoming
+            return frame
+
+        return VideoClip(frame_function=frame_function, duration=end - start)
+
     async def _create_scene_clips(
         self,
+        job_id: str,
         scenes: List[Dict],
-        media_files_with_metadata: List[tuple]
-    ) -> List[VideoFileClip]:
+        media_files_with_metadata: List[tuple],
+        scene_dir: Optional[Path] = None
+    ) -> List["VideoFileClip"]:
         """
         Create video clips for each scene with SMART features:
         - Proper aspect ratio cropping (no distortion!)
         - Variable playback speed based on content
         - AI-selected transitions
 
+        Each scene is pre-rendered to an mp4 by a worker process driving
+        FFmpeg, using metadata probed up front for all sources at once. Scenes
+        that would render identical frames from the same source share one
+        render: a video at the same playback speed (or a still without Ken
+        Burns) is rendered once at the longest requested length, and shorter
+        scenes play a prefix of it - each source is decoded once per job.
+        The transitions' fades are applied here, in the main process. If
+        anything fails, the scene files written so far are removed.
+
         Args:
+            job_id: Unique job identifier (used to name the scene files)
             media_files_with_metadata: List of (media_path, metadata) tuples
+            scene_dir: Where to write scene files (defaults to temp_dir)
         """
-        from concurrent.futures import ThreadPoolExecutor
-        import asyncio
+        from moviepy import VideoFileClip
 
-        print(f"🎬 Processing {len(media_files_with_metadata)} clips in PARALLEL (using all M4 cores)...")
+        max_workers = _available_cpus()
+        print(f"🎬 Rendering {len(media_files_with_metadata)} scenes in PARALLEL ({max_workers} processes)...")
 
-        # Process clips in parallel for 3x speed boost!
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        probes = await self._probe_all([media_path for media_path, _ in media_files_with_metadata])
 
-            tasks = []
-            for i, (scene, (media_path, metadata)) in enumerate(zip(scenes, media_files_with_metadata)):
-                task = loop.run_in_executor(
-                    executor,
-                    self._create_single_clip,
-                    scene,
-                    media_path,
-                    metadata,
-                    i
-                )
-                tasks.append(task)
+        scene_dir = scene_dir or self.temp_dir
 
-            clips = await asyncio.gather(*tasks)
+        # key -> (scene, metadata, output path) of the longest scene using it
+        renders = {}
+        render_keys = []
+        for i, (scene, (media_path, metadata)) in enumerate(zip(scenes, media_files_with_metadata)):
+            duration = scene.get('duration', 5)
+            if media_path.suffix.lower() in ['.mp4', '.mov', '.avi']:
+                key = (media_path, metadata.get('playback_speed', 1.0))
+            elif self.ken_burns:
+                key = (media_path, duration)  # Zoom speed depends on scene length
+            else:
+                key = (media_path,)
+            render_keys.append(key)
 
-        print(f"✅ All clips processed in parallel!")
+            if key not in renders:
+                renders[key] = (scene, metadata, scene_dir / f"{job_id}_scene_{i:03d}.mp4")
+            elif duration > renders[key][0].get('duration', 5):
+                renders[key] = (scene, metadata, renders[key][2])
+
+        if len(renders) < len(render_keys):
+            print(f"♻️ {len(render_keys) - len(renders)} scenes reuse another scene's render")
+
+        clips = []
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                tasks = []
+                for (media_path, *_), (scene, metadata, output_path) in renders.items():
+                    task = loop.run_in_executor(
+                        executor,
+                        self._create_single_clip,
+                        scene,
+                        media_path,
+                        metadata,
+                        output_path,
+                        probes.get(media_path)
+                    )
+                    tasks.append(task)
+
+                await asyncio.gather(*tasks)
+
+            for scene, key, (_, metadata) in zip(scenes, render_keys, media_files_with_metadata):
+                render_scene, _, scene_path = renders[key]
+                clip = VideoFileClip(str(scene_path))
+                if render_scene is not scene:
+                    # Shared render made for a longer scene - play its prefix
+                    clip = clip.subclipped(0, min(scene.get('duration', 5), clip.duration))
+                # Apply AI-selected transition
+                clip = self._apply_smart_transition(clip, metadata.get('transition_out', 'crossfade'))
+                clips.append(clip)
+        except BaseException:
+            for clip in clips:
+                clip.close()
+            for _, _, scene_path in renders.values():
+                scene_path.unlink(missing_ok=True)
+            raise
+
+        print(f"✅ All scenes rendered in parallel!")
         return clips
 
+    async def _probe_all(self, paths: List[Path]) -> Dict[Path, Dict]:
+        """
+        Probe every source file concurrently before rendering starts.
+
+        ffprobe runs as a subprocess, so plain threads give full parallelism;
+        results are cached per (path, mtime, size) across jobs.
+
+        Returns:
+            {path: {'width', 'height', 'duration', 'fps'}} - keys may be missing
+            when a value couldn't be read
+        """
+        loop = asyncio.get_running_loop()
+        unique = [path for path in dict.fromkeys(paths) if path.exists()]
+
+        def probe(path: Path) -> Dict:
+            stat = path.stat()
+            return _probe_media(str(path), stat.st_mtime_ns, stat.st_size)
+
+        results = await asyncio.gather(*[loop.run_in_executor(None, probe, path) for path in unique])
+        return dict(zip(unique, results))
+
     def _create_single_clip(
         self,
         scene: Dict,
         media_path: Path,
         metadata: Dict,
-        index: int
-    ):
-        """Create a single clip with all smart features (runs in thread pool)."""
+        output_path: Path,
+        probe: Optional[Dict] = None
+    ) -> Path:
+        """Render a single scene to an mp4 with all smart features (runs in process pool)."""
         duration = scene.get('duration', 5)
         playback_speed = metadata.get('playback_speed', 1.0)
-        transition_out = metadata.get('transition_out', 'crossfade')
 
         # Create clip based on media type
-        if media_path.suffix.lower() in ['.mp4', '.mov', '.avi']:
-            # Video file
-            clip = VideoFileClip(str(media_path))
-
-            # Apply playback speed BEFORE duration adjustment
-            if playback_speed != 1.0:
-                # Speed up/slow down the video
-                clip = clip.with_fps(clip.fps)
-                clip = clip.with_effects([])  # Clear effects
-                # Adjust duration by changing speed
-                if playback_speed < 1.0:
-                    # Slow motion - extend duration
-                    clip = clip.with_fps(int(clip.fps * playback_speed))
-                elif playback_speed > 1.0:
-                    # Speed up - reduce duration
-                    clip = clip.with_fps(int(clip.fps * playback_speed))
-
-            # Take only the needed duration
-            clip_duration = min(duration / playback_speed, clip.duration)
-            clip = clip.subclipped(0, clip_duration)
-
-            if clip.duration < duration:
-                # Loop if video is too short
-                loops = int(duration / clip.duration) + 1
-                clip = concatenate_videoclips([clip] * loops)
-                clip = clip.subclipped(0, duration)
-        else:
-            # Image file
-            clip = ImageClip(str(media_path), duration=duration)
+        if media_path.suffix.lower() not in ['.mp4', '.mov', '.avi']:
+            # Image file - FFmpeg holds the single decoded frame and the encoder
+            # sees zero motion, so stills are almost free to render
+            return self._render_still(media_path, duration, output_path, probe)
+
+        # Video file - decode, retime, fit and encode in one native FFmpeg pass.
+        # Short sources are decoded once: the loop filter keeps the fitted
+        # frames of one pass in memory and replays them, and -t stops the output
+        # once the scene is filled. Sources too long to hold in memory (or of
+        # unknown length) repeat in the demuxer with -stream_loop instead.
+        # Steps the probe shows to be unnecessary are left out.
+        probe = probe or {}
+        cached_frames = 0
+        needs_loop = probe.get('duration', 0) < duration * playback_speed
+        if needs_loop and probe.get('duration'):
+            cached_frames = math.ceil(probe['duration'] / playback_speed * self.fps)
+            if cached_frames * self._target_w * self._target_h * 3 > _LOOP_CACHE_BYTES:
+                cached_frames = 0
+
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error']
+        if needs_loop and not cached_frames:
+            cmd += ['-stream_loop', '-1']
+        cmd += ['-i', str(media_path), '-t', str(duration)]
+
+        filters = []
+        if playback_speed != 1.0:
+            # <1.0 = slow motion, >1.0 = speed up
+            filters.append(f'setpts=PTS/{playback_speed}')
+        if playback_speed != 1.0 or probe.get('fps') != self.fps:
+            filters.append(f'fps={self.fps}')
+        filters.append(self._fit_filter(source_size=(probe.get('width'), probe.get('height'))))
+        if cached_frames:
+            filters.append(f'loop=loop=-1:size={cached_frames}:start=0')
+        if filters:
+            cmd += ['-vf', ','.join(filters)]
+
+        cmd += [
+            '-an',
+            # Near-lossless intermediate - the final export does the real encode
+            '-c:v', 'libx264', '-preset', 'ultrafast',
+            '-crf', '16', '-pix_fmt', 'yuv420p',
+            str(output_path)
+        ]
+        subprocess.run(cmd, check=True, capture_output=True)
+        return output_path
+
+    def _render_still(
+        self,
+        media_path: Path,
+        duration: float,
+        output_path: Path,
+        probe: Optional[Dict] = None
+    ) -> Path:
+        """
+        Render a still image scene entirely in FFmpeg (no per-frame Python work).
 
-        # SMART CROP for aspect ratio (no distortion!)
-        clip = self._smart_crop_and_resize(clip)
+        With Ken Burns enabled the image is decoded once, fitted at 2x the
+        output size (so zoompan's integer crop offsets don't make the pan
+        jitter), and zoompan emits every frame of a slow 100% -> 110% zoom from
+        that single decoded frame. Otherwise the loop filter repeats the one
+        fitted frame and the encoder sees zero motion.
+        """
+        source_size = ((probe or {}).get('width'), (probe or {}).get('height'))
+        if self.ken_burns:
+            frames = max(1, round(duration * self.fps))
+            input_args = ['-i', str(media_path)]
+            video_filter = (
+                f"{self._fit_filter(self._target_w * 2, self._target_h * 2, source_size)},"
+                f"zoompan=z='1+0.1*on/{frames}'"
+                f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+                f":d={frames}:s={self._target_w}x{self._target_h}:fps={self.fps}"
+            )
+            tune = 'film'
+        else:
+            # Decode and fit once; the loop filter replays that single frame
+            # (-loop 1 would re-read, decode and scale the file every frame)
+            input_args = ['-framerate', str(self.fps), '-i', str(media_path)]
+            video_filter = f'{self._fit_filter(source_size=source_size)},loop=loop=-1:size=1:start=0'
+            tune = 'stillimage'
+
+        subprocess.run(
+            [
+                'ffmpeg', '-y', '-loglevel', 'error'
+            ]
+            + input_args
+            + [
+                '-t', str(duration),
+                '-vf', video_filter,
+                '-c:v', 'libx264', '-preset', 'ultrafast', '-tune', tune,
+                '-crf', '16', '-pix_fmt', 'yuv420p',
+                str(output_path)
+            ],
+            check=True,
+            capture_output=True
+        )
+        return output_path
 
-        # Apply AI-selected transition
-        clip = self._apply_smart_transition(clip, transition_out)
+    def _fit_filter(
+        self,
+        target_w: Optional[int] = None,
+        target_h: Optional[int] = None,
+        source_size: Optional[tuple] = None
+    ) -> str:
+        """
+        FIT media to aspect ratio - SHOW ENTIRE IMAGE with letterboxing if needed.
 
-        return clip
+        Uses 'contain' strategy - fits entire image within frame. Returned as an
+        FFmpeg filter chain so scaling runs in libswscale (lanczos) rather than
+        per frame through PIL. Defaults to the output resolution.
 
-    def _smart_crop_and_resize(self, clip):
+        When the probed source size is known the geometry is worked out here
+        once, and the scale or pad step is left out entirely if it would be a
+        no-op (e.g. 1280x720 footage into a 16:9 video needs neither).
         """
-        FIT media to aspect ratio - SHOW ENTIRE IMAGE with letterboxing if needed.
-        
-        Uses 'contain' strategy - fits entire image within frame.
-        """
-        target_w, target_h = self.resolution
-        
-        # Simple resize with aspect ratio preservation - MoviePy handles it!
-        # This will fit the entire image within the target resolution
-        clip = clip.with_effects([
-            Resize(height=target_h if self.aspect_ratio == "9:16" else target_w)
-        ])
-        
-        # If clip is now smaller than target, add black bars (letterbox)
-        # This ensures you see the ENTIRE image, not cropped
-        return clip
+        target_w = target_w or self._target_w
+        target_h = target_h or self._target_h
+        source_w, source_h = source_size or (None, None)
+
+        if not (source_w and source_h):
+            # Unknown source - let FFmpeg do the geometry per stream
+            return (
+                f'scale={target_w}:{target_h}:force_original_aspect_ratio=decrease'
+                f':force_divisible_by=2:flags=lanczos,'
+                f'pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2:color=black,setsar=1'
+            )
+
+        # Scale so the whole image fits inside the target resolution, then add
+        # black bars (letterbox) so every scene has the exact output size
+        scale = min(target_w / source_w, target_h / source_h)
+        fit_w = min(target_w, round(source_w * scale / 2) * 2)
+        fit_h = min(target_h, round(source_h * scale / 2) * 2)
+
+        filters = []
+        if (fit_w, fit_h) != (source_w, source_h):
+            filters.append(f'scale={fit_w}:{fit_h}:flags=lanczos')
+        if (fit_w, fit_h) != (target_w, target_h):
+            filters.append(
+                f'pad={target_w}:{target_h}:{(target_w - fit_w) // 2}:{(target_h - fit_h) // 2}:color=black'
+            )
+        filters.append('setsar=1')
+        return ','.join(filters)
 
     def _apply_smart_transition(self, clip, transition_type: str):
-        """Apply AI-selected transition to clip."""
-        if transition_type == "crossfade":
-            # Smooth crossfade (peaceful content)
-            return clip.with_effects([
-                CrossFadeIn(0.5),
-                CrossFadeOut(0.5)
-            ])
-        elif transition_type == "zoom":
-            # Zoom effect (emphasis)
-            return clip.with_effects([
-                CrossFadeIn(0.3),
-                CrossFadeOut(0.3)
-            ])
-        elif transition_type == "quick_cut":
-            # No transition (fast-paced)
-            return clip.with_effects([
-                FadeIn(0.1),
-                FadeOut(0.1)
-            ])
-        elif transition_type == "fade_black":
-            # Dramatic pause
-            return clip.with_effects([
-                FadeIn(0.2),
-                FadeOut(0.5)  # Longer fade out
-            ])
-        else:
-            # Default crossfade
-            return clip.with_effects([
-                CrossFadeIn(0.5),
-                CrossFadeOut(0.5)
-            ])
+        """
+        Apply the AI-selected transition's fades to black to a clip.
 
-    def _apply_ken_burns_effect(
-        self,
-        clip: ImageClip,
-        duration: float
-    ) -> ImageClip:
-        """Apply Ken Burns (slow zoom) effect to image clip."""
-        def zoom(t):
-            # Gradually zoom from 100% to 110% over the duration
-            factor = 1 + 0.1 * (t / duration)
-            return factor
-
-        # Apply zoom effect (simplified for compatibility)
-        # Note: Dynamic resize not fully supported in MoviePy 2.x yet
-        # Using static resize as fallback
-        return clip
+        Fades run on the uint8 frames via _fast_blend; the crossfade part of
+        the transition is applied where scenes overlap, in _chain_scenes.
+        """
+        _, fade_in, fade_out = _TRANSITIONS.get(transition_type, _TRANSITIONS['crossfade'])
+        if not fade_in and not fade_out:
+            return clip
+
+        duration = clip.duration
+
+        def fade(get_frame, t):
+            frame = get_frame(t)
+            level = 1.0
+            if fade_in and t < fade_in:
+                level = t / fade_in
+            if fade_out and duration - t < fade_out:
+                level = min(level, (duration - t) / fade_out)
+            if level >= 1.0:
+                return frame
+            return _fast_blend(frame, 0, round(255 * max(0.0, level)))
+
+        return clip.transform(fade)
+
+    def _write_ass_file(self, captions: List[Dict], ass_path: Path) -> str:
+        """
+        Write captions as an ASS subtitle script and return the matching filter.
+
+        libass rasterizes each line once and blends it inside the encoder's
+        filter chain, so captions never pass through the Python compositor.
+
+        Args:
+            captions: Caption dicts with text, timing and style keys
+            ass_path: Where to write the .ass file
+
+        Returns:
+            'subtitles=' filter string for FFmpeg's -vf
+        """
+        width, height = self._target_w, self._target_h
+        alignments = {'bottom': 2, 'center': 5, 'top': 8}
+        styles: Dict[tuple, str] = {}
+        events = []
+        fonts_dir = None
+
+        def timestamp(seconds: float) -> str:
+            centis = int(round(max(0.0, seconds) * 100))
+            return f"{centis // 360000}:{centis // 6000 % 60:02d}:{centis // 100 % 60:02d}.{centis % 100:02d}"
+
+        for caption in captions:
+            font = caption.get('font', '/System/Library/Fonts/Helvetica.ttc')
+            stroke_color = caption.get('stroke_color', 'black')
+            has_stroke = bool(stroke_color) and stroke_color != 'none'
+            position = caption.get('position', ('center', 'bottom'))
+            vertical = position[1] if isinstance(position, (tuple, list)) else position
+
+            key = (
+                font,
+                caption.get('font_size', 70),
+                caption.get('color', 'white'),
+                stroke_color if has_stroke else None,
+                caption.get('stroke_width', 3) if has_stroke else 0,
+                alignments.get(vertical, 2)
+            )
+            if key not in styles:
+                styles[key] = f"s{len(styles)}"
+                if fonts_dir is None and Path(font).exists():
+                    fonts_dir = Path(font).parent
+
+            text = (
+                str(caption['text'])
+                .replace('{', '\\{')
+                .replace('}', '\\}')
+                .replace('\n', '\\N')
+            )
+            events.append(
+                f"Dialogue: 0,{timestamp(caption['start_time'])},{timestamp(caption['end_time'])},"
+                f"{styles[key]},,0,0,0,,{{\\fad(100,100)}}{text}"
+            )
+
+        margin_h = int(width * 0.05)
+        margin_v = int(height * 0.05)
+        lines = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            f"PlayResX: {width}",
+            f"PlayResY: {height}",
+            "WrapStyle: 0",
+            "ScaledBorderAndShadow: yes",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+            "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, "
+            "Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
+        ]
+        for (font, font_size, color, stroke_color, stroke_width, alignment), name in styles.items():
+            lines.append(
+                f"Style: {name},{Path(font).stem},{font_size},{_ass_color(color)},{_ass_color(color)},"
+                f"{_ass_color(stroke_color)},&H00000000,0,0,0,0,100,100,0,0,1,{stroke_width},0,"
+                f"{alignment},{margin_h},{margin_h},{margin_v},1"
+            )
+        lines += [
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ] + events
+
+        ass_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        caption_filter = f"subtitles=filename={_escape_filter_value(str(ass_path))}"
+        if fonts_dir:
+            caption_filter += f":fontsdir={_escape_filter_value(str(fonts_dir))}"
+        return caption_filter
 
     def _add_captions_to_video(
         self,
-        video: CompositeVideoClip,
+        video: "VideoClip",
         captions: List[Dict]
-    ) -> CompositeVideoClip:
-        """Add captions/subtitles to video."""
-        caption_clips = []
+    ) -> "VideoClip":
+        """
+        Add captions/subtitles to video (fallback when FFmpeg has no libass).
+
+        Each caption is rasterized once, split into uint8 RGB + alpha planes,
+        and blended straight into the frame with _fast_blend - only the
+        caption's own rectangle is touched, instead of MoviePy compositing a
+        full-frame layer per caption clip.
+        """
+        from moviepy import VideoClip
+
+        frame_w, frame_h = video.size
+        overlays = []
 
         for caption in captions:
             text = caption['text']
             start = caption['start_time']
             end = caption['end_time']
-            duration = end - start
 
             # Get caption style (MoviePy 2.x parameter names)
             font_size = caption.get('font_size', 70)
@@ -380,44 +1324,68 @@ class VideoGenerator:
             stroke_width = caption.get('stroke_width', 3)
             font = caption.get('font', '/System/Library/Fonts/Helvetica.ttc')
 
-            # Create text clip with MoviePy 2.x parameters
+            # Rasterize once per unique (text, style), then reuse the bitmap
             try:
-                txt_clip = TextClip(
-                    text=text,
-                    font_size=font_size,
-                    color=color,
-                    font=font,
-                    stroke_color=stroke_color if stroke_color and stroke_color != 'none' else None,
-                    stroke_width=stroke_width if stroke_color and stroke_color != 'none' else 0,
-                    method='caption',
-                    size=(int(self.resolution[0] * 0.9), None),
-                    text_align='center'
+                bitmap = _render_text_bitmap(
+                    text,
+                    font_size,
+                    color,
+                    stroke_color,
+                    stroke_width,
+                    font,
+                    int(self._target_w * 0.9)
                 )
-
-                # Position caption (MoviePy 2.x uses with_position instead of set_position)
-                position = caption.get('position', ('center', 'bottom'))
-                txt_clip = txt_clip.with_position(position)
-
-                # Set timing (MoviePy 2.x uses with_start and with_duration)
-                txt_clip = txt_clip.with_start(start).with_duration(duration)
-
-                # Add fade in/out for smooth caption appearance
-                txt_clip = txt_clip.with_effects([
-                    FadeIn(0.1),
-                    FadeOut(0.1)
-                ])
-
-                caption_clips.append(txt_clip)
-
             except Exception as e:
                 print(f"Error creating caption '{text}': {e}")
                 continue
 
-        # Composite video with captions
-        if caption_clips:
-            video = CompositeVideoClip([video] + caption_clips)
-
-        return video
+            # Clip to the frame, then resolve the position to a top-left corner
+            # (edge positions keep the same 5% margins as the ASS captions)
+            bitmap = bitmap[:frame_h, :frame_w]
+            height, width = bitmap.shape[:2]
+            margin_h = int(frame_w * 0.05)
+            margin_v = int(frame_h * 0.05)
+            # A bare string is the vertical placement, as in the ASS captions;
+            # unknown names fall back to centered at the bottom like there too
+            position = caption.get('position', ('center', 'bottom'))
+            if not isinstance(position, (tuple, list)):
+                position = ('center', position)
+            xs = {
+                'left': margin_h,
+                'center': (frame_w - width) // 2,
+                'right': frame_w - width - margin_h
+            }
+            ys = {
+                'top': margin_v,
+                'center': (frame_h - height) // 2,
+                'bottom': frame_h - height - margin_v
+            }
+            x = position[0] if isinstance(position[0], (int, float)) else xs.get(position[0], xs['center'])
+            y = position[1] if isinstance(position[1], (int, float)) else ys.get(position[1], ys['bottom'])
+            x = max(0, min(int(x), frame_w - width))
+            y = max(0, min(int(y), frame_h - height))
+
+            rgb = np.ascontiguousarray(bitmap[..., :3])
+            alpha = np.ascontiguousarray(bitmap[..., 3:])
+            overlays.append((start, end, x, y, rgb, alpha))
+
+        if not overlays:
+            return video
+
+        def composite(t):
+            frame = np.array(video.get_frame(t), dtype=np.uint8)
+            for start, end, x, y, rgb, alpha in overlays:
+                if not start <= t < end:
+                    continue
+                # 0.1s fade in/out for smooth caption appearance
+                fade = min(1.0, (t - start) / 0.1, (end - t) / 0.1)
+                height, width = alpha.shape[:2]
+                region = frame[y:y + height, x:x + width]
+                weight = alpha if fade >= 1.0 else _fast_blend(alpha, 0, round(255 * fade))
+                region[:] = _fast_blend(rgb, region, weight)
+            return frame
+
+        return VideoClip(frame_function=composite, duration=video.duration)
 
     def create_preview(
         self,
@@ -425,39 +1393,72 @@ class VideoGenerator:
         media_files: List[Path],
         duration: float = 5.0
     ) -> Path:
-        """Create a quick preview video from media files."""
-        clips = []
+        """
+        Create a quick preview video from media files.
 
+        The preview has a fixed layout (up to 5 sources, letterboxed and
+        concatenated), so it is built as one FFmpeg filter graph instead of
+        going through MoviePy - no frames pass through Python at all.
+        """
         clip_duration = duration / len(media_files)
 
-        for media_path in media_files[:5]:  # Max 5 clips for preview
+        # Previews only need 360p on the short side (640x360 for 16:9)
+        scale = 360 / min(self._target_w, self._target_h)
+        preview_w = int(self._target_w * scale) // 2 * 2
+        preview_h = int(self._target_h * scale) // 2 * 2
+
+        inputs = []
+        filters = []
+        sources = media_files[:5]  # Max 5 clips for preview
+        for i, media_path in enumerate(sources):
             if media_path.suffix.lower() in ['.mp4', '.mov', '.avi']:
-                clip = VideoFileClip(str(media_path))
-                clip = clip.subclipped(0, min(clip_duration, clip.duration))
+                # -t on the input also stops early on shorter videos
+                inputs += ['-t', f'{clip_duration:.3f}', '-i', str(media_path)]
             else:
-                clip = ImageClip(str(media_path), duration=clip_duration)
-
-            # Resize for preview
-            clip = clip.with_effects([Resize(self.resolution)])
-            clips.append(clip)
+                inputs += ['-loop', '1', '-framerate', str(self.fps), '-t', f'{clip_duration:.3f}', '-i', str(media_path)]
+            filters.append(
+                f'[{i}:v]{self._fit_filter(preview_w, preview_h)},fps={self.fps},'
+                f'format=yuv420p,setpts=PTS-STARTPTS[v{i}]'
+            )
+        filters.append(''.join(f'[v{i}]' for i in range(len(sources))) + f'concat=n={len(sources)}:v=1:a=0[out]')
 
-        # Concatenate clips
-        preview_video = concatenate_videoclips(clips, method="compose")
+        if self.hardware_encoder:
+            encoder_params = ['-c:v', 'h264_videotoolbox', '-realtime', '1']
+        else:
+            # No B-frame lookahead and short GOP - previews are throwaway
+            encoder_params = ['-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'zerolatency', '-g', '30']
 
-        # Export preview
         preview_path = self.output_dir / f"{job_id}_preview.mp4"
-        preview_video.write_videofile(
-            str(preview_path),
-            fps=30,
-            codec='libx264',
-            preset='ultrafast'
+        result = subprocess.run(
+            ['ffmpeg', '-y', '-loglevel', 'error', '-nostats']
+            + inputs
+            + ['-filter_complex', ';'.join(filters), '-map', '[out]', '-an', '-r', str(self.fps)]
+            + encoder_params
+            + ['-pix_fmt', 'yuv420p', '-movflags', '+faststart', str(preview_path)],
+            capture_output=True
         )
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors='replace').strip()
+            raise RuntimeError(f"FFmpeg exited with code {result.returncode}: {stderr}")
 
-        preview_video.close()
         return preview_path
 
     def get_video_info(self, video_path: Path) -> Dict[str, any]:
         """Get information about a video file."""
+        stat = video_path.stat()
+        probe = _probe_media(str(video_path), stat.st_mtime_ns, stat.st_size)
+        if {'width', 'height', 'duration', 'fps'} <= probe.keys():
+            return {
+                'duration': probe['duration'],
+                'fps': probe['fps'],
+                'size': [probe['width'], probe['height']],
+                'resolution': f"{probe['width']}x{probe['height']}",
+                'aspect_ratio': probe['width'] / probe['height']
+            }
+
+        # ffprobe unavailable - fall back to opening the file with MoviePy
+        from moviepy import VideoFileClip
+
         clip = VideoFileClip(str(video_path))
 
         info = {
@@ -1,9 +1,16 @@
 """AI-powered video quality enhancement and review system."""
 
+import copy
+import hashlib
+import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any
 import httpx
 
+# Most analyses kept per enhancer (least recently used are dropped first)
+_ANALYSIS_CACHE_SIZE = 256
+
 
 class VideoQualityEnhancer:
     """Uses AI to review and enhance video quality."""
@@ -11,6 +18,8 @@ class VideoQualityEnhancer:
     def __init__(self, openai_api_key: Optional[str] = None):
         """Initialize quality enhancer."""
         self.openai_api_key = openai_api_key
+        # Prompt hash -> analysis, so unchanged iterations skip the API call
+        self._analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
     async def analyze_video_quality(
         self,
@@ -22,6 +31,10 @@ class VideoQualityEnhancer:
         """
         Use AI to analyze video quality and suggest improvements.
 
+        Analyses are cached by a hash of the prompt, so a pass over an
+        unchanged script and parameters returns the previous result without
+        calling the API.
+
         Returns suggestions for the next generation iteration.
         """
         if not self.openai_api_key:
@@ -57,6 +70,13 @@ Return JSON:
     "overall_assessment": "Good start, but..."
 }}"""
 
+            cache_key = hashlib.sha256(analysis_prompt.encode("utf-8")).hexdigest()
+            if cache_key in self._analysis_cache:
+                print(f"♻️ Script unchanged - reusing previous AI quality analysis")
+                self._analysis_cache.move_to_end(cache_key)
+                # Callers get their own copy - the cached entry stays pristine
+                return copy.deepcopy(self._analysis_cache[cache_key])
+
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
@@ -85,11 +105,12 @@ Return JSON:
                 response.raise_for_status()
                 data = response.json()
 
-                import json
-                analysis = json.loads(data['choices'][0]['message']['content'])
-
-                print(f"🎯 AI Quality Analysis Complete! Score: {analysis.get('quality_score', 0)}/10")
-                return analysis
+            analysis = json.loads(data['choices'][0]['message']['content'])
+            self._analysis_cache[cache_key] = copy.deepcopy(analysis)
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            print(f"🎯 AI Quality Analysis Complete! Score: {analysis.get('quality_score', 0)}/10")
+            return analysis
 
         except Exception as e:
             print(f"Quality analysis error: {e}")
@@ -1,30 +1,220 @@
 """Voiceover management with recording and TTS options."""
 
 import asyncio
+import bisect
+import functools
+import hashlib
+import math
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List, Union
 import subprocess
+from contextlib import asynccontextmanager
+
+import numpy as np
+
+# Imported once here rather than inside the decode path; pydub is only
+# the fallback decoder, so the app still runs without it
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+
+# VBR ~165 kbps for voice. compression_level is LAME's algorithm quality
+# (0 = slowest); 7 encodes ~15% faster with no audible cost for speech
+_MP3_ENCODE_ARGS = ["-c:a", "libmp3lame", "-q:a", "4", "-compression_level", "7"]
+
+# Worker processes for CPU-bound audio work, shared by every job and
+# created on first use
+_audio_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_audio_pool() -> ProcessPoolExecutor:
+    """Return the shared audio process pool, starting it if needed."""
+    global _audio_pool
+    if _audio_pool is None:
+        _audio_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _audio_pool
+
+
+def _open_audio(audio_path: Union[str, Path]) -> 'AudioSegment':
+    """Decode an audio file with pydub (and its ffmpeg decode)."""
+    if AudioSegment is None:
+        raise ImportError("pydub is required to decode this audio format")
+    return AudioSegment.from_file(audio_path)
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_pauses(audio_path: str, mtime_ns: int, size: int, min_pause_ms: int = 150) -> tuple:
+    """
+    Midpoints, in seconds, of the pauses between stretches of speech.
+
+    Gaps shorter than min_pause_ms (between words, mostly) don't count.
+    mtime_ns and size only key the cache, which holds just the small tuple -
+    the decoded samples are dropped as soon as the scan is done.
+    """
+    samples, frame_rate = _read_pcm16(Path(audio_path))
+    ranges = VoiceoverManager._non_silent_ranges(samples, frame_rate, 32768)
+    return tuple(
+        (end + start) / 2000
+        for (_, end), (start, _) in zip(ranges, ranges[1:])
+        if start - end >= min_pause_ms
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_duration(audio_path: str, mtime: float, size: int) -> float:
+    """
+    Duration of an audio file in seconds.
+
+    mtime and size only key the cache, so a file rewritten in place (the
+    processed voiceover, say) is probed again instead of served stale.
+    """
+    # Read the container metadata instead of decoding every sample
+    try:
+        out = subprocess.check_output(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'csv=p=0', audio_path],
+            stderr=subprocess.DEVNULL
+        )
+        return float(out.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        pass
+
+    return len(_open_audio(audio_path)) / 1000.0  # Convert milliseconds to seconds
+
+
+def _read_pcm16(audio_path: Path) -> tuple:
+    """
+    Decode an audio file to 16-bit PCM.
+
+    libsndfile reads WAV/FLAC/OGG (and MP3 from 1.1) natively; pydub and
+    its ffmpeg decode are only used for what it can't open. Nothing is
+    cached - the caller owns the samples.
+
+    Returns:
+        (int16 samples shaped (frames, channels), sample rate)
+    """
+    try:
+        import soundfile as sf
+
+        return sf.read(str(audio_path), dtype="int16", always_2d=True)
+    except (ImportError, RuntimeError):  # LibsndfileError is a RuntimeError
+        audio = _open_audio(audio_path).set_sample_width(2)
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+        return samples.reshape(-1, audio.channels), audio.frame_rate
+
+
+def _prepare_pcm(audio_path: Path, normalize: bool, remove_silence: bool) -> tuple:
+    """
+    Decode, peak-normalize and trim a voiceover (runs in the audio pool).
+
+    Returns:
+        (16-bit PCM bytes, sample rate, channels)
+    """
+    # Load audio (decoded once, as 16-bit PCM)
+    samples, frame_rate = _read_pcm16(audio_path)
+
+    # Normalize audio levels - peak to 0.1 dB below full scale, like pydub's normalize
+    if normalize:
+        peak = int(np.max(np.abs(samples.astype(np.int32)))) if samples.size else 0
+        if peak:
+            gain = 32768 * 10 ** (-0.1 / 20) / peak
+            samples = np.clip(np.round(samples * gain), -32768, 32767).astype(np.int16)
+
+    # Remove silence from beginning and end
+    if remove_silence:
+        start, end = VoiceoverManager._trim_silence_frames(samples, frame_rate)
+        samples = samples[start:end]
+
+    return np.ascontiguousarray(samples).tobytes(), frame_rate, samples.shape[1]
 
 
 class VoiceoverManager:
     """Manages voiceovers - both user recordings and TTS."""
 
-    def __init__(self, storage_dir: Path = Path("./data/voiceovers")):
+    # Loaded Coqui models by name, shared by every instance - loading one
+    # takes seconds and hundreds of MB, so it happens once per process
+    _tts_models: Dict[str, Any] = {}
+    _tts_model_locks: Dict[str, asyncio.Lock] = {}
+
+    def __init__(self, storage_dir: Path = Path("./data/voiceovers"), max_cache_mb: int = 500):
         """Initialize voiceover manager."""
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+        # Synthesized speech keyed by text + voice settings, so unchanged
+        # scripts (e.g. quality-iteration retries) skip the TTS round trip
+        self.cache_dir = storage_dir / "cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cache_mb = max_cache_mb
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        self._cache_lock_users: Dict[str, int] = {}
+
+        # One second of encoded silence, built on first use; fallback audio
+        # of any length is looped from it by stream copy instead of encoded
+        self.silent_template = storage_dir / "silent_1s.mp3"
+        self._silent_template_lock = asyncio.Lock()
+
+    async def warmup(self):
+        """
+        Pay the cheap one-off startup costs before the first request has to.
+
+        Checks ffmpeg is runnable and builds the silent fallback template.
+        Failures are reported but never fatal - the request path retries.
+        """
+        try:
+            await self._run_ffmpeg("-version")
+            await self._get_silent_template()
+        except Exception as e:
+            print(f"⚠️ FFmpeg warm-up failed: {e}")
+
+    async def preload_tts_model(self):
+        """Load the default Coqui model into the shared cache (slow - run it in the background)."""
+        try:
+            from TTS.api import TTS
+
+            await self._get_coqui_model(TTS, "tts_models/en/ljspeech/tacotron2-DDC")
+        except Exception as e:
+            print(f"⚠️ Coqui TTS preload skipped: {e}")
+
     async def save_recording(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, AsyncIterator[bytes], Any],
         job_id: str,
         format: str = "mp3"
     ) -> Path:
-        """Save user's voice recording."""
+        """
+        Save user's voice recording.
+
+        Accepts raw bytes, an async iterator of byte chunks (e.g. a request
+        body stream) or an upload object with an async read() (FastAPI's
+        UploadFile). Streams are written to disk 1 MB at a time, so memory
+        stays flat however long the recording is.
+        """
         filename = f"{job_id}_recording.{format}"
         file_path = self.storage_dir / filename
+        partial_path = file_path.with_name(f".{file_path.stem}.part{file_path.suffix}")
+
+        # Write to a temp name so an interrupted upload leaves no partial file
+        try:
+            with open(partial_path, "wb") as f:
+                if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                    f.write(audio_data)
+                elif hasattr(audio_data, "read"):
+                    while chunk := await audio_data.read(1 << 20):
+                        f.write(chunk)
+                else:
+                    async for chunk in audio_data:
+                        f.write(chunk)
+            os.replace(partial_path, file_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
 
-        file_path.write_bytes(audio_data)
         return file_path
 
     async def generate_tts(
@@ -41,10 +231,64 @@ class VoiceoverManager:
         filename = f"{job_id}_tts.mp3"
         file_path = self.storage_dir / filename
 
+        # Keyed on everything that changes the synthesized audio
+        cache_key = hashlib.blake2b(
+            f"{use_gtts}|{voice}|{rate}|{pitch}|{volume}|{text}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        cached_path = self.cache_dir / f"{cache_key}.mp3"
+
+        # Concurrent requests for the same speech wait for a single synthesis
+        async with self._cache_lock(cache_key):
+            if cached_path.exists():
+                print(f"♻️ Reusing cached voiceover for unchanged script ({cache_key})")
+                self._link_or_copy(cached_path, file_path)
+                os.utime(cached_path)  # Mark as recently used for LRU eviction
+                return file_path
+
+            return await self._synthesize(text, file_path, cached_path, voice, use_gtts, rate, pitch, volume)
+
+    @asynccontextmanager
+    async def _cache_lock(self, cache_key: str):
+        """Hold the lock for one cache key, dropping it once nobody holds or waits on it."""
+        lock = self._cache_locks.setdefault(cache_key, asyncio.Lock())
+        self._cache_lock_users[cache_key] = self._cache_lock_users.get(cache_key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._cache_lock_users[cache_key] -= 1
+            if not self._cache_lock_users[cache_key]:
+                del self._cache_lock_users[cache_key]
+                del self._cache_locks[cache_key]
+
+    async def _synthesize(
+        self,
+        text: str,
+        file_path: Path,
+        cached_path: Path,
+        voice: str,
+        use_gtts: bool,
+        rate: str,
+        pitch: str,
+        volume: str
+    ) -> Path:
+        """
+        Run the TTS engine chain, caching only Edge TTS results.
+
+        The cache key names the Edge voice and prosody; a fallback engine's
+        audio (a different voice entirely) must not be served under it, and
+        the next request should get another shot at Edge anyway.
+        """
+        # A previous run may have left a hard link to a cache entry here;
+        # engines that write in place must not truncate the cached copy
+        file_path.unlink(missing_ok=True)
+
         # Try Edge TTS first - FREE Microsoft voices, very natural!
         try:
             print(f"🎙️ Generating voiceover with Edge TTS (Microsoft) - Natural {voice} voice...")
-            return await self._generate_edge_tts(text, file_path, voice, rate, pitch, volume)
+            result = await self._generate_edge_tts(text, file_path, voice, rate, pitch, volume)
+            return self._store_in_cache(result, cached_path)
         except Exception as e:
             print(f"Edge TTS error: {e}, trying Coqui TTS")
 
@@ -61,7 +305,8 @@ class VoiceoverManager:
                 from gtts import gTTS
                 print(f"🎙️ Generating voiceover with gTTS (robotic fallback)...")
                 tts = gTTS(text=text, lang='en', slow=False)
-                tts.save(str(file_path))
+                # Blocking HTTP round trips - keep them off the event loop
+                await asyncio.to_thread(tts.save, str(file_path))
                 print(f"✅ Voiceover generated with gTTS")
                 return file_path
             except Exception as e:
@@ -75,6 +320,37 @@ class VoiceoverManager:
         # If all fail, create silent audio as fallback
         return await self._create_silent_audio(file_path, duration=5)
 
+    def _link_or_copy(self, source: Path, destination: Path):
+        """Hard-link source to destination (copy if links aren't possible), replacing it atomically."""
+        temp_path = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+        temp_path.unlink(missing_ok=True)
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, destination)
+
+    def _store_in_cache(self, file_path: Path, cached_path: Path) -> Path:
+        """Add a freshly synthesized voiceover to the cache and evict old entries."""
+        try:
+            self._link_or_copy(file_path, cached_path)
+            self._evict_cache()
+        except OSError as e:
+            print(f"⚠️ Could not cache voiceover: {e}")
+        return file_path
+
+    def _evict_cache(self):
+        """Drop least recently used cache entries until the cache fits in max_cache_mb."""
+        entries = [(path.stat(), path) for path in self.cache_dir.glob("*.mp3")]
+        total = sum(stat.st_size for stat, _ in entries)
+        limit = self.max_cache_mb * 1024 * 1024
+
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+            if total <= limit:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
     async def _generate_edge_tts(
         self,
         text: str,
@@ -161,7 +437,19 @@ class VoiceoverManager:
                 pitch=pitch,    # Pitch control: "-50Hz" to "+50Hz"
                 volume=volume   # Volume control: "-50%" to "+50%"
             )
-            await communicate.save(str(output_path))
+
+            # Stream audio chunks straight to disk instead of buffering the
+            # whole MP3; write to a temp name so a failed run leaves no partial file
+            partial_path = output_path.with_name(f".{output_path.stem}.part{output_path.suffix}")
+            try:
+                with open(partial_path, "wb") as f:
+                    async for chunk in communicate.stream():
+                        if chunk["type"] == "audio":
+                            f.write(chunk["data"])
+                os.replace(partial_path, output_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
 
             print(f"✅ Natural voiceover generated with Edge TTS!")
             return output_path
@@ -190,14 +478,27 @@ class VoiceoverManager:
                 # Default to female
                 model_name = "tts_models/en/ljspeech/tacotron2-DDC"
 
-            print(f"🎙️ Loading Coqui TTS model: {model_name}...")
-            tts = TTS(model_name=model_name, progress_bar=False, gpu=False)
+            tts = await self._get_coqui_model(TTS, model_name)
+            lock = self._tts_model_locks[model_name]
 
-            # Generate speech
-            if voice == "male" and model_name == "tts_models/en/vctk/vits":
-                tts.tts_to_file(text=text, file_path=str(output_path), speaker=speaker)
-            else:
-                tts.tts_to_file(text=text, file_path=str(output_path))
+            partial_path = output_path.with_name(f".{output_path.stem}.part{output_path.suffix}")
+
+            def synthesize():
+                import torch
+
+                kwargs = {"text": text, "file_path": str(partial_path)}
+                if voice == "male" and model_name == "tts_models/en/vctk/vits":
+                    kwargs["speaker"] = speaker
+                # No autograd bookkeeping - this is pure inference
+                with torch.inference_mode():
+                    tts.tts_to_file(**kwargs)
+                os.replace(partial_path, output_path)
+
+            # Inference is compute-bound; keep it off the event loop. The
+            # shared model keeps decoder state on itself between steps, so
+            # jobs using the same model take turns
+            async with lock:
+                await asyncio.to_thread(synthesize)
 
             print(f"✅ High-quality voiceover generated!")
             return output_path
@@ -205,6 +506,29 @@ class VoiceoverManager:
         except Exception as e:
             raise Exception(f"Coqui TTS generation failed: {e}")
 
+    async def _get_coqui_model(self, tts_class, model_name: str):
+        """Return the shared Coqui model, loading it on first use."""
+        # Only one caller loads a given model; the rest wait and reuse it.
+        # Locks are per model, so loading one never stalls users of another
+        lock = self._tts_model_locks.setdefault(model_name, asyncio.Lock())
+        tts = self._tts_models.get(model_name)
+        if tts is None:
+            async with lock:
+                tts = self._tts_models.get(model_name)
+                if tts is None:
+                    tts = await asyncio.to_thread(self._load_coqui_model, tts_class, model_name)
+                    self._tts_models[model_name] = tts
+        return tts
+
+    @staticmethod
+    def _load_coqui_model(tts_class, model_name: str):
+        """Load a Coqui model and move it to the GPU once, if there is one."""
+        import torch
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        print(f"🎙️ Loading Coqui TTS model: {model_name} ({device})...")
+        return tts_class(model_name=model_name, progress_bar=False).to(device)
+
     async def _create_silent_audio(
         self,
         output_path: Path,
@@ -212,96 +536,310 @@ class VoiceoverManager:
     ) -> Path:
         """Create silent audio file as fallback."""
         try:
-            # Use ffmpeg to create silent audio
-            cmd = [
-                "ffmpeg", "-f", "lavfi", "-i",
-                f"anullsrc=r=44100:cl=stereo",
-                "-t", str(duration),
-                "-q:a", "9", "-acodec", "libmp3lame",
-                str(output_path), "-y"
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            # Loop the template past the duration and cut - copy only, no encode
+            template = await self._get_silent_template()
+            await self._run_ffmpeg(
+                "-stream_loop", str(max(0, math.ceil(duration) - 1)), "-i", str(template),
+                "-t", str(duration), "-c", "copy", str(output_path), "-y"
             )
-            await process.communicate()
             return output_path
 
         except Exception as e:
             raise Exception(f"Failed to create silent audio: {e}")
 
+    async def _get_silent_template(self) -> Path:
+        """Return the cached silent MP3, encoding it on first use."""
+        async with self._silent_template_lock:
+            if not self.silent_template.exists():
+                partial_path = self.silent_template.with_suffix(".part.mp3")
+                await self._run_ffmpeg(
+                    "-f", "lavfi", "-i", "anullsrc=r=44100:cl=stereo",
+                    "-t", "1",
+                    "-q:a", "9", "-acodec", "libmp3lame",
+                    str(partial_path), "-y"
+                )
+                os.replace(partial_path, self.silent_template)
+        return self.silent_template
+
+    @staticmethod
+    async def _run_ffmpeg(*args: str):
+        """Run ffmpeg with the given arguments, raising on failure."""
+        # Nothing is read from stdout; stderr only ever carries errors, so
+        # the pipe stays tiny however long the run
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-nostdin", "-nostats", "-loglevel", "error", *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(stderr.decode(errors="replace").strip())
+
     async def process_audio(
         self,
         audio_path: Path,
         normalize: bool = True,
-        remove_silence: bool = False
+        remove_silence: bool = False,
+        use_ffmpeg: bool = True
     ) -> Path:
-        """Process audio file - normalize volume, remove silence, etc."""
-        from pydub import AudioSegment
-        from pydub.effects import normalize as pydub_normalize
+        """
+        Process audio file - normalize volume, remove silence, etc.
+
+        Runs as a single FFmpeg pass (decode, trim, loudness-normalize,
+        encode) by default. The fallback decodes once (libsndfile, else
+        pydub), peak-normalizes and trims the samples in NumPy - in the
+        shared audio process pool, so jobs don't serialize on the event
+        loop - and pipes the raw PCM straight into one MP3 encode.
+        """
+        processed_path = audio_path.parent / f"{audio_path.stem}_processed.mp3"
 
-        # Load audio
-        audio = AudioSegment.from_file(audio_path)
+        if not (normalize or remove_silence) and audio_path.suffix.lower() == ".mp3":
+            # Nothing to change - re-encoding would only cost time and quality
+            self._link_or_copy(audio_path, processed_path)
+            return processed_path
 
-        # Normalize audio levels
-        if normalize:
-            audio = pydub_normalize(audio)
+        # Encode beside the target and swap it in: processed_path may be a
+        # hard link to the source (or a cache entry) from an earlier no-op
+        # call, and writing through it would overwrite that file
+        partial_path = processed_path.with_name(f".{processed_path.stem}.part{processed_path.suffix}")
+        try:
+            if use_ffmpeg:
+                try:
+                    await self._process_audio_ffmpeg(audio_path, partial_path, normalize, remove_silence)
+                    os.replace(partial_path, processed_path)
+                    return processed_path
+                except Exception as e:
+                    print(f"FFmpeg audio processing failed: {e}, using pydub")
+
+            pcm, frame_rate, channels = await asyncio.get_running_loop().run_in_executor(
+                _get_audio_pool(), _prepare_pcm, audio_path, normalize, remove_silence
+            )
+
+            # Save processed audio - raw PCM straight into the encoder
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y", "-nostats", "-loglevel", "error",
+                "-f", "s16le", "-ar", str(frame_rate), "-ac", str(channels), "-i", "pipe:0",
+                *_MP3_ENCODE_ARGS, str(partial_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await process.communicate(pcm)
+            if process.returncode != 0:
+                raise Exception(f"Audio encode failed: {stderr.decode(errors='replace').strip()}")
+
+            os.replace(partial_path, processed_path)
+            return processed_path
+        finally:
+            partial_path.unlink(missing_ok=True)
 
-        # Remove silence from beginning and end
+    async def _process_audio_ffmpeg(
+        self,
+        audio_path: Path,
+        processed_path: Path,
+        normalize: bool,
+        remove_silence: bool
+    ) -> Path:
+        """Trim leading/trailing silence and loudness-normalize in one FFmpeg pass."""
+        filters = []
         if remove_silence:
-            # Detect non-silent parts
-            non_silent = self._detect_non_silent(audio)
-            if non_silent:
-                start, end = non_silent[0][0], non_silent[-1][1]
-                audio = audio[start:end]
+            # Leading silence, then trailing silence via a reversed pass
+            # (stop_periods would also cut pauses inside the speech)
+            trim = "silenceremove=start_periods=1:start_duration=0.01:start_threshold=-40dB"
+            filters += [trim, "areverse", trim, "areverse"]
+        if normalize:
+            # EBU R128 loudness target for spoken voice
+            filters.append("loudnorm=I=-16:TP=-1.5:LRA=11")
 
-        # Save processed audio
-        processed_path = audio_path.parent / f"{audio_path.stem}_processed.mp3"
-        audio.export(processed_path, format="mp3", bitrate="192k")
+        args = ["-y", "-i", str(audio_path)]
+        if filters:
+            args += ["-af", ",".join(filters)]
+        # loudnorm upsamples to 192 kHz internally - resample for the MP3
+        args += ["-ar", "44100", *_MP3_ENCODE_ARGS, str(processed_path)]
 
+        await self._run_ffmpeg(*args)
         return processed_path
 
+    @staticmethod
+    def _trim_silence_frames(
+        samples: np.ndarray,
+        frame_rate: int,
+        window_ms: int = 40,
+        cutoff_db: int = -40
+    ) -> tuple:
+        """
+        Find where sound starts and ends in (frames, channels) samples, as frame offsets.
+
+        Like DALI's nonsilent_region: a window is silent when its mean power
+        is more than cutoff_db below the loudest sample's power. Only the two
+        ends are scanned - block by block inward until the first loud window -
+        so the middle of the recording is never windowed at all. Audio that
+        is silent throughout is left untrimmed.
+        """
+        mono = samples.astype(np.float32).mean(axis=1)  # Mono downmix
+        power = np.square(mono)
+        window = max(1, int(frame_rate * window_ms / 1000))
+        if not power.size or power.max() == 0 or len(power) < window:
+            return 0, len(power)
+        threshold = power.max() * 10 ** (cutoff_db / 10)
+        block = window * 256
+
+        def first_loud(values: np.ndarray) -> int:
+            """Sample offset of the first loud window, scanning from the start."""
+            for offset in range(0, len(values) - window + 1, block):
+                chunk = values[offset:offset + block]
+                chunk = chunk[:len(chunk) // window * window]
+                loud = np.flatnonzero(chunk.reshape(-1, window).mean(axis=1) > threshold)
+                if loud.size:
+                    return offset + int(loud[0]) * window
+            return 0
+
+        return first_loud(power), len(power) - first_loud(power[::-1])
+
+    @staticmethod
     def _detect_non_silent(
-        self,
         audio: 'AudioSegment',
         silence_threshold: int = -40,
-        chunk_size: int = 10
+        chunk_size: int = 10,
+        seek_step: int = 1
     ) -> List[tuple]:
-        """Detect non-silent chunks in audio."""
-        from pydub.silence import detect_nonsilent
+        """Detect non-silent chunks in a pydub segment as [start_ms, end_ms] ranges."""
+        samples = np.array(audio.get_array_of_samples()).reshape(-1, audio.channels)
+        return VoiceoverManager._non_silent_ranges(
+            samples, audio.frame_rate, audio.max_possible_amplitude,
+            silence_threshold, chunk_size, seek_step
+        )
 
-        return detect_nonsilent(
-            audio,
-            min_silence_len=chunk_size,
-            silence_thresh=silence_threshold
+    @staticmethod
+    def _non_silent_ranges(
+        samples: np.ndarray,
+        frame_rate: int,
+        max_amplitude: float,
+        silence_threshold: int = -40,
+        chunk_size: int = 10,
+        seek_step: int = 1
+    ) -> List[tuple]:
+        """
+        Detect non-silent chunks in (frames, channels) samples as [start_ms, end_ms] ranges.
+
+        Same results as pydub's detect_nonsilent: a chunk_size window tested
+        every seek_step ms is silent when its RMS - over the interleaved
+        samples of every channel, truncated to an int like audioop.rms - is
+        at or below the threshold, and whatever no silent window covers is
+        non-silent. Window energies all come from one cumulative sum instead
+        of slicing an AudioSegment in Python.
+        """
+        frames, channels = samples.shape
+        length_ms = round(1000 * frames / frame_rate)
+        if length_ms < chunk_size:
+            return [[0, length_ms]]
+
+        # Per-frame energy summed across channels, then cumulative
+        energy = np.concatenate(([0], np.cumsum(np.square(samples.astype(np.int64)).sum(axis=1))))
+
+        # Window starts every seek_step ms, always including the last full window
+        window_starts = np.arange(0, length_ms - chunk_size + 1, seek_step)
+        if window_starts[-1] != length_ms - chunk_size:
+            window_starts = np.append(window_starts, length_ms - chunk_size)
+
+        # Frame offsets exactly as pydub slices by milliseconds; frames past
+        # the end count as padded silence
+        frames_per_ms = frame_rate / 1000.0
+        start_frames = (window_starts * frames_per_ms).astype(np.int64)
+        end_frames = ((window_starts + chunk_size) * frames_per_ms).astype(np.int64)
+        totals = energy[np.minimum(end_frames, frames)] - energy[np.minimum(start_frames, frames)]
+        counts = (end_frames - start_frames) * channels
+
+        rms = np.floor(np.sqrt(totals / np.maximum(counts, 1)))
+        threshold = 10 ** (silence_threshold / 20) * max_amplitude
+        silent_starts = window_starts[rms <= threshold]
+
+        # Mark every millisecond covered by a silent window
+        coverage = (
+            np.bincount(silent_starts, minlength=length_ms + 1)
+            - np.bincount(silent_starts + chunk_size, minlength=length_ms + 1)
         )
+        nonsilent_mask = np.cumsum(coverage[:length_ms]) == 0
+
+        # Rising/falling edges of the mask mark range starts/ends
+        edges = np.diff(np.concatenate(([0], nonsilent_mask.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        return [[int(start), int(end)] for start, end in zip(starts, ends)]
 
     def get_audio_duration(self, audio_path: Path) -> float:
         """Get duration of audio file in seconds."""
-        from pydub import AudioSegment
+        stat = os.stat(audio_path)
+        return _probe_duration(str(audio_path), stat.st_mtime, stat.st_size)
 
-        audio = AudioSegment.from_file(audio_path)
-        return len(audio) / 1000.0  # Convert milliseconds to seconds
+    async def get_audio_duration_async(self, audio_path: Path) -> float:
+        """Get duration of audio file in seconds, probing off the event loop."""
+        return await asyncio.to_thread(self.get_audio_duration, audio_path)
 
     async def sync_audio_to_script(
         self,
         audio_path: Path,
         script_scenes: List[dict]
     ) -> List[dict]:
-        """Sync audio timestamps with script scenes."""
-        total_duration = self.get_audio_duration(audio_path)
+        """
+        Sync audio timestamps with script scenes.
 
-        # Simple approach: divide audio equally among scenes
+        The audio is divided equally among scenes, then each boundary snaps
+        to the nearest pause in the speech (within half a scene), so scenes
+        and captions change between sentences rather than mid-word.
+        """
+        total_duration = await self.get_audio_duration_async(audio_path)
         scene_duration = total_duration / len(script_scenes)
+        boundaries = [i * scene_duration for i in range(len(script_scenes) + 1)]
 
-        synced_scenes = []
-        for i, scene in enumerate(script_scenes):
-            synced_scene = scene.copy()
-            synced_scene['audio_start'] = i * scene_duration
-            synced_scene['audio_end'] = (i + 1) * scene_duration
-            synced_scene['duration'] = scene_duration
-            synced_scenes.append(synced_scene)
+        try:
+            stat = os.stat(audio_path)
+            pauses = await asyncio.to_thread(
+                _detect_pauses, str(audio_path), stat.st_mtime_ns, stat.st_size
+            )
+            boundaries = self._snap_to_pauses(boundaries, pauses, scene_duration / 2)
+        except Exception as e:
+            print(f"⚠️ Pause detection failed ({e}), splitting audio evenly")
+
+        return [
+            {
+                **scene,
+                'audio_start': start,
+                'audio_end': end,
+                'duration': end - start,
+            }
+            for scene, start, end in zip(script_scenes, boundaries, boundaries[1:])
+        ]
+
+    @staticmethod
+    def _snap_to_pauses(
+        boundaries: List[float],
+        pauses: tuple,
+        max_shift: float,
+        min_scene: float = 1.0
+    ) -> List[float]:
+        """
+        Move each interior boundary to the nearest pause no more than max_shift away.
 
-        return synced_scenes
+        A pause is only taken when the scenes on both sides stay at least
+        min_scene long - measured against the boundary already placed before
+        it and the original boundary after it - otherwise the original
+        boundary is kept. The default leaves room for the 0.5 s crossfade
+        overlap the video generator lays between scenes.
+        """
+        snapped = [boundaries[0]]
+        for target, next_boundary in zip(boundaries[1:-1], boundaries[2:]):
+            i = bisect.bisect_left(pauses, target)
+            nearest = min(pauses[max(i - 1, 0):i + 1], key=lambda pause: abs(pause - target), default=None)
+            if (
+                nearest is not None
+                and abs(nearest - target) <= max_shift
+                and nearest - snapped[-1] >= min_scene
+                and next_boundary - nearest >= min_scene
+            ):
+                target = nearest
+            snapped.append(target)
+        snapped.append(boundaries[-1])
+        return snapped
@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """API test client, started once and only when an API test runs."""
+    from src.app.web import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,32 +1,31 @@
 """Tests for API endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
-from src.app.web import app
 
-client = TestClient(app)
+pytestmark = pytest.mark.api
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/healthz")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
 
 
-def test_generate_video_no_script():
+def test_generate_video_no_script(client):
     """Test video generation without script."""
     response = client.post("/api/generate", data={})
     assert response.status_code == 422  # Validation error
 
 
-def test_generate_video_with_script():
+@pytest.mark.slow
+def test_generate_video_with_script(client):
     """Test video generation with valid script."""
     response = client.post(
         "/api/generate",
@@ -46,13 +45,13 @@ def test_generate_video_with_script():
     assert data["status"] == "pending"
 
 
-def test_job_status_not_found():
+def test_job_status_not_found(client):
     """Test job status for non-existent job."""
     response = client.get("/api/status/nonexistent-job-id")
     assert response.status_code == 404
 
 
-def test_settings_get():
+def test_settings_get(client):
     """Test getting settings."""
     response = client.get("/api/settings")
     assert response.status_code == 200
@@ -60,7 +59,7 @@ def test_settings_get():
     assert "has_gemini" in data
 
 
-def test_settings_post():
+def test_settings_post(client):
     """Test saving settings."""
     response = client.post(
         "/api/settings",
@@ -73,7 +72,7 @@ def test_settings_post():
     assert response.json()["message"] == "Settings saved successfully"
 
 
-def test_list_jobs():
+def test_list_jobs(client):
     """Test listing jobs."""
     response = client.get("/api/jobs")
     assert response.status_code == 200
@@ -1,10 +1,14 @@
 """Tests for service modules."""
 
+import asyncio
+import json
 import pytest
 from pathlib import Path
 from src.services.script_enhancer import ScriptEnhancer
 from src.services.caption_generator import CaptionGenerator
 
+pytestmark = pytest.mark.unit
+
 
 def test_script_enhancer_basic():
     """Test basic script enhancement without API keys."""
@@ -31,27 +35,33 @@ def test_script_enhancer_keywords():
     assert len(keywords) > 0
 
 
-def test_caption_generator_srt_time():
-    """Test SRT time formatting."""
-    generator = CaptionGenerator()
+@pytest.fixture(scope="module")
+def caption_generator():
+    """Caption generator shared by the formatting tests."""
+    return CaptionGenerator()
 
-    time_str = generator._format_srt_time(65.5)
-    assert time_str == "00:01:05,500"
 
-    time_str = generator._format_srt_time(3661.123)
-    assert time_str == "01:01:01,123"
+@pytest.mark.parametrize("seconds, expected", [
+    (0, "00:00:00,000"),
+    (65.5, "00:01:05,500"),
+    (3661.123, "01:01:01,123"),
+    (7325.25, "02:02:05,250"),
+])
+def test_caption_generator_srt_time(caption_generator, seconds, expected):
+    """Test SRT time formatting."""
+    assert caption_generator._format_srt_time(seconds) == expected
 
 
-def test_caption_generator_style_config():
+@pytest.mark.parametrize("style, font_size, color", [
+    ("modern", 70, "white"),
+    ("classic", 60, "yellow"),
+    ("uppercase", 75, "white"),
+])
+def test_caption_generator_style_config(caption_generator, style, font_size, color):
     """Test caption style configurations."""
-    generator = CaptionGenerator()
-
-    modern_style = generator.get_caption_style_config("modern")
-    assert modern_style["fontsize"] == 70
-    assert modern_style["color"] == "white"
-
-    classic_style = generator.get_caption_style_config("classic")
-    assert classic_style["color"] == "yellow"
+    config = caption_generator.get_caption_style_config(style)
+    assert config["font_size"] == font_size
+    assert config["color"] == color
 
 
 @pytest.mark.asyncio
@@ -70,3 +80,271 @@ async def test_caption_from_script():
     assert len(captions) > 0
     assert captions[0]["start_time"] >= 0
     assert "text" in captions[0]
+
+
+def test_video_generator_writes_ass_captions(tmp_path):
+    """Test captions are written as an ASS script for the subtitles filter."""
+    from src.services.video_generator import VideoGenerator
+
+    generator = VideoGenerator(output_dir=tmp_path, temp_dir=tmp_path)
+    ass_path = tmp_path / "captions.ass"
+
+    caption_filter = generator._write_ass_file(
+        [{"text": "Hello {world}", "start_time": 1.0, "end_time": 2.5, "color": "yellow"}],
+        ass_path
+    )
+
+    content = ass_path.read_text(encoding="utf-8")
+    assert caption_filter.startswith("subtitles=filename=")
+    assert "PlayResX: 1280" in content
+    assert "&H0000FFFF" in content
+    assert "Dialogue: 0,0:00:01.00,0:00:02.50,s0,,0,0,0,,{\\fad(100,100)}Hello \\{world\\}" in content
+
+
+def test_video_generator_fit_filter_skips_noop_steps(tmp_path):
+    """Test the letterbox fit only scales/pads when the probed size needs it."""
+    from src.services.video_generator import VideoGenerator
+
+    generator = VideoGenerator(output_dir=tmp_path, temp_dir=tmp_path)
+
+    assert generator._fit_filter(source_size=(1280, 720)) == "setsar=1"
+    assert generator._fit_filter(source_size=(640, 360)) == "scale=1280:720:flags=lanczos,setsar=1"
+    assert "pad=1280:720:438:0" in generator._fit_filter(source_size=(1080, 1920))
+    assert "force_original_aspect_ratio" in generator._fit_filter()
+
+
+@pytest.mark.asyncio
+async def test_voiceover_tts_cache_skips_regeneration(tmp_path, monkeypatch):
+    """Test an unchanged script reuses the cached voiceover instead of re-synthesizing."""
+    from src.services.voiceover_manager import VoiceoverManager
+
+    manager = VoiceoverManager(storage_dir=tmp_path)
+    calls = []
+
+    async def fake_edge_tts(text, file_path, voice, rate, pitch, volume):
+        calls.append(text)
+        await asyncio.sleep(0.01)
+        file_path.write_bytes(b"fake-mp3")
+        return file_path
+
+    monkeypatch.setattr(manager, "_generate_edge_tts", fake_edge_tts)
+
+    # Concurrent identical requests share one synthesis
+    first, second = await asyncio.gather(
+        manager.generate_tts("Hello there", "job1"),
+        manager.generate_tts("Hello there", "job2")
+    )
+
+    assert calls == ["Hello there"]
+    assert second.read_bytes() == first.read_bytes() == b"fake-mp3"
+    assert not manager._cache_locks
+
+
+@pytest.mark.asyncio
+async def test_voiceover_tts_cache_skips_fallback_engines(tmp_path, monkeypatch):
+    """Test a fallback engine's audio is never cached under the Edge voice's key."""
+    from src.services.voiceover_manager import VoiceoverManager
+
+    manager = VoiceoverManager(storage_dir=tmp_path)
+
+    async def failing_edge_tts(*args):
+        raise RuntimeError("offline")
+
+    async def fake_coqui_tts(text, file_path, voice):
+        file_path.write_bytes(b"coqui-mp3")
+        return file_path
+
+    monkeypatch.setattr(manager, "_generate_edge_tts", failing_edge_tts)
+    monkeypatch.setattr(manager, "_generate_coqui_tts", fake_coqui_tts)
+
+    result = await manager.generate_tts("Hello there", "job1")
+
+    assert result.read_bytes() == b"coqui-mp3"
+    assert not list(manager.cache_dir.glob("*.mp3"))
+
+
+def test_voiceover_detect_non_silent_ranges(tmp_path):
+    """Test silence detection finds the tone between leading and trailing silence."""
+    import numpy as np
+    from pydub import AudioSegment
+    from src.services.voiceover_manager import VoiceoverManager
+
+    rate = 8000
+    tone = (np.sin(np.arange(rate // 2) * 0.3) * 16000).astype(np.int16)
+    silence = np.zeros(rate // 4, dtype=np.int16)
+    pcm = np.concatenate([silence, tone, silence])
+    audio = AudioSegment(pcm.tobytes(), frame_rate=rate, sample_width=2, channels=1)
+
+    manager = VoiceoverManager(storage_dir=tmp_path)
+
+    assert manager._detect_non_silent(audio) == [[250, 750]]
+
+
+def test_voiceover_detect_non_silent_matches_pydub():
+    """Test silence detection agrees with pydub on mono and stereo inputs near the threshold."""
+    import numpy as np
+    from pydub import AudioSegment
+    from pydub.silence import detect_nonsilent
+    from src.services.voiceover_manager import VoiceoverManager
+
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        channels = int(rng.integers(1, 3))
+        rate = int(rng.choice([8000, 11025, 22050, 44100]))
+        # Noise bursts straddling the -40 dBFS threshold (~328 RMS)
+        pcm = np.concatenate([
+            (rng.standard_normal((int(rng.integers(1, rate // 4)), channels)) * amplitude).astype(np.int16)
+            for amplitude in rng.choice([0, 300, 330, 400, 3000], size=int(rng.integers(1, 6)))
+        ])
+        audio = AudioSegment(pcm.tobytes(), frame_rate=rate, sample_width=2, channels=channels)
+        seek_step = int(rng.choice([1, 3]))
+
+        assert VoiceoverManager._detect_non_silent(audio, -40, 10, seek_step) == \
+            detect_nonsilent(audio, 10, -40, seek_step)
+
+
+def test_fast_blend_rounds_like_float_blend():
+    """Test the uint8 blend matches a rounded float blend at every alpha."""
+    import numpy as np
+    from src.services.video_generator import _fast_blend
+
+    a = np.arange(256, dtype=np.uint8)
+    b = a[::-1].copy()
+    for alpha in (0, 1, 64, 128, 254, 255):
+        expected = np.round((a.astype(int) * alpha + b.astype(int) * (255 - alpha)) / 255).astype(np.uint8)
+        assert np.array_equal(_fast_blend(a, b, alpha), expected)
+
+
+@pytest.mark.asyncio
+async def test_quality_analysis_is_cached_per_script(monkeypatch):
+    """Test an unchanged script reuses the previous analysis instead of calling the API."""
+    import httpx
+    from src.services import video_quality_enhancer
+    from src.services.video_quality_enhancer import VideoQualityEnhancer
+
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        content = json.dumps({"quality_score": 6, "improved_keywords": ["sunrise"]})
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        video_quality_enhancer.httpx,
+        "AsyncClient",
+        lambda: real_client(transport=httpx.MockTransport(handler))
+    )
+
+    enhancer = VideoQualityEnhancer(openai_api_key="test")
+    scenes = [{"duration": 5}]
+
+    first = await enhancer.analyze_video_quality(Path("video.mp4"), "Script", scenes, ["sun"])
+    first["improved_keywords"].append("mutated")
+    second = await enhancer.analyze_video_quality(Path("video.mp4"), "Script", scenes, ["sun"])
+
+    assert second == {"quality_score": 6, "improved_keywords": ["sunrise"]}
+    assert len(requests) == 1
+
+
+def test_voiceover_fallback_trims_only_edge_silence(tmp_path):
+    """Test the fallback processing path trims leading/trailing silence but keeps pauses."""
+    import wave
+    import numpy as np
+    from src.services.voiceover_manager import _prepare_pcm
+
+    rate = 8000
+    tone = (np.sin(np.arange(rate // 2) * 0.3) * 16000).astype(np.int16)
+    pause = np.zeros(rate // 5, dtype=np.int16)
+    silence = np.zeros(rate // 4, dtype=np.int16)
+    audio_path = tmp_path / "voice.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.concatenate([silence, tone, pause, tone, silence]).tobytes())
+
+    pcm, frame_rate, channels = _prepare_pcm(audio_path, normalize=False, remove_silence=True)
+
+    # Bounds snap outward to the 40 ms analysis windows: 240 ms to 1460 ms
+    assert (frame_rate, channels) == (rate, 1)
+    assert len(pcm) // 2 == (1460 - 240) * rate // 1000
+
+
+@pytest.mark.asyncio
+async def test_voiceover_sync_snaps_scenes_to_pauses(tmp_path):
+    """Scene boundaries land in the pauses between sentences."""
+    import wave
+    import numpy as np
+    from src.services.voiceover_manager import VoiceoverManager
+
+    # 6 s of tone with pauses centered at 1.6 s and 4.4 s
+    rate = 8000
+    t = np.arange(6 * rate) / rate
+    samples = (np.sin(2 * np.pi * 440 * t) * 10000).astype(np.int16)
+    for center in (1.6, 4.4):
+        samples[int((center - 0.1) * rate):int((center + 0.1) * rate)] = 0
+    audio_path = tmp_path / "voice.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+
+    manager = VoiceoverManager(tmp_path / "voiceovers")
+    scenes = await manager.sync_audio_to_script(audio_path, [{"text": "a"}, {"text": "b"}, {"text": "c"}])
+
+    assert [round(scene["audio_start"], 2) for scene in scenes] == [0, 1.6, 4.4]
+    assert scenes[-1]["audio_end"] == pytest.approx(6.0)
+    assert sum(scene["duration"] for scene in scenes) == pytest.approx(6.0)
+
+
+def test_voiceover_snap_skips_pauses_that_would_squash_a_scene():
+    """Two pauses close together can't both become boundaries."""
+    from src.services.voiceover_manager import VoiceoverManager
+
+    snapped = VoiceoverManager._snap_to_pauses([0, 10, 20, 30], (14.99, 15.01), 5.0)
+
+    assert snapped == [0, 14.99, 20, 30]
+    assert min(end - start for start, end in zip(snapped, snapped[1:])) >= 1.0
+
+
+@pytest.mark.asyncio
+async def test_voiceover_processing_never_writes_through_a_linked_source(tmp_path, monkeypatch):
+    """Test re-processing after a no-op (hard-linked) pass leaves the source untouched."""
+    from src.services.voiceover_manager import VoiceoverManager
+
+    manager = VoiceoverManager(storage_dir=tmp_path)
+    source = tmp_path / "speech.mp3"
+    source.write_bytes(b"original")
+
+    async def fake_run_ffmpeg(*args):
+        with open(args[-1], "wb") as output:  # Truncates in place, like ffmpeg -y
+            output.write(b"normalized")
+
+    monkeypatch.setattr(manager, "_run_ffmpeg", fake_run_ffmpeg)
+
+    linked = await manager.process_audio(source, normalize=False)
+    processed = await manager.process_audio(source, normalize=True)
+
+    assert linked == processed
+    assert processed.read_bytes() == b"normalized"
+    assert source.read_bytes() == b"original"
+    assert not list(tmp_path.glob(".*.part*"))
+
+
+@pytest.mark.asyncio
+async def test_voiceover_failed_upload_leaves_no_partial_file(tmp_path):
+    """Test a recording stream that breaks midway is cleaned up, not left as a .part file."""
+    from src.services.voiceover_manager import VoiceoverManager
+
+    manager = VoiceoverManager(storage_dir=tmp_path)
+
+    async def broken_stream():
+        yield b"first chunk"
+        raise ConnectionError("client went away")
+
+    with pytest.raises(ConnectionError):
+        await manager.save_recording(broken_stream(), "job-1")
+
+    assert not list(tmp_path.glob("*recording*"))